@@ -1,6 +1,10 @@
+import random
+from typing import FrozenSet
+
 import streamlit as st
-from streamlit import legacy_caching
 
+from wordle.data import load_all_words
+from wordle.engine import SolverEngine
 from wordle.game import StreamlitWordle
 
 MARKDOWN_ANSWER_TEMPLATE = """
@@ -20,9 +24,26 @@ WORDLE_RULES = """
 """
 
 
-@st.cache(allow_output_mutation=True)
+@st.cache_resource
+def load_vocabulary() -> FrozenSet[str]:
+    """Valid guesses, loaded once per server process and shared by every session."""
+    return frozenset(load_all_words())
+
+
+@st.cache_resource
+def load_engine() -> SolverEngine:
+    """Solver shared by every session, which Streamlit runs in separate threads.
+
+    Each session only keeps its own immutable solver state.  Solver rankings are
+    memoized per process, so each hint position is computed once for all users.
+    """
+    return SolverEngine()
+
+
 def new_game():
-    return StreamlitWordle()
+    st.session_state.game = StreamlitWordle(seed=random.getrandbits(32), silent=True)
+    st.session_state.solver_state = load_engine().new_session()
+    st.session_state.hints = None
 
 
 st.title("Wordle!")
@@ -30,15 +51,36 @@ st.title("Wordle!")
 with st.expander("Game Rules"):
     st.markdown(WORDLE_RULES, unsafe_allow_html=True)
 
-game = new_game()
+vocabulary = load_vocabulary()
+engine = load_engine()
+if "game" not in st.session_state:
+    new_game()
+game: StreamlitWordle = st.session_state.game
 game.render_streamlit()
 
 if not game.done:
     with st.form("Form"):
-        guess = st.text_input("Enter your guess: ").strip()
+        guess = st.text_input("Enter your guess: ").strip().lower()
         if st.form_submit_button("Submit"):
-            game.step(guess)
-            st.experimental_rerun()
+            if guess in vocabulary:
+                st.session_state.solver_state = engine.update(
+                    st.session_state.solver_state, game.step(guess)
+                )
+                st.rerun()
+            else:
+                st.warning(f"'{guess}' is not a valid word.")
+
+    if st.checkbox("Show solver hints"):
+        # Hints are kept until the next guess, so reruns don't recompute them
+        step, hints = st.session_state.hints or (None, None)
+        if step != len(game.history):
+            hints = engine.recommend(st.session_state.solver_state)
+            st.session_state.hints = (len(game.history), hints)
+        if hints.recommended is not None:
+            st.markdown(f"Recommended: **{hints.recommended.upper()}**")
+        if hints.alternatives:
+            alternatives = ", ".join(w.upper() for w in hints.alternatives)
+            st.markdown(f"Alternatives: {alternatives}")
 
 else:
     if game._success:
@@ -51,5 +93,5 @@ else:
         )
 
     if st.button("New Game"):
-        legacy_caching.clear_cache()
-        st.experimental_rerun()
+        new_game()
+        st.rerun()
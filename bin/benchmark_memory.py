@@ -0,0 +1,224 @@
+import gc
+import importlib
+import json
+import multiprocessing
+import os
+import pkgutil
+import platform
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+import wordle
+from wordle.data import load_all_words, load_fallback_words, load_words
+from wordle.game import Wordle
+from wordle.solver import MultiWordleSolver, WordleSolver
+
+GAME_MODES = (
+    "probability",
+    "avg-split",
+    "max-split",
+    "entropy",
+    "turns-to-win",
+    "win-percentage",
+    "lookahead",
+)
+MULTI_BOARDS = (2, 4, 8, 16)
+
+MB = 2**20
+
+
+def _rss_mb() -> Optional[float]:
+    """Current resident set size, where '/proc' is available (Linux)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / MB
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, and in kilobytes elsewhere
+    return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+def _lru_caches() -> Dict[str, Callable]:
+    """Every module-level 'lru_cache' in the package, by qualified name.
+
+    Modules are found by walking the package, skipping any whose optional
+    dependencies aren't installed.
+    """
+    caches = {}
+    for info in pkgutil.walk_packages(wordle.__path__, prefix="wordle."):
+        name = info.name
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        for attr, value in vars(module).items():
+            if callable(value) and hasattr(value, "cache_info"):
+                if getattr(value, "__module__", None) == name:
+                    caches[f"{name}.{attr}"] = value
+    return dict(sorted(caches.items()))
+
+
+def _play_game(answer: str, mode: str):
+    game = Wordle(silent=True)
+    game._word = answer
+    solver = WordleSolver(mode=mode)
+    guess = solver.recommend().recommended
+    while guess is not None and guess != game._word and not game.done:
+        guess = solver.update(game.step(guess))
+
+
+def _sample_answers(num_games: int, seed: int = 0) -> List[str]:
+    return random.Random(seed).sample(load_words(), num_games)
+
+
+def _scenario(name: str, num_games: int) -> Callable[[], object]:
+    """Work to measure for a scenario.  The returned object is kept alive."""
+    if name == "load-words":
+        return load_words
+    elif name == "load-all-words":
+        return load_all_words
+    elif name == "load-fallback-words":
+        return load_fallback_words
+    elif name == "wordle-solver":
+        return WordleSolver
+    elif name.startswith("multi-solver-"):
+        num_words = int(name.rsplit("-", 1)[-1])
+        return lambda: MultiWordleSolver(num_words=num_words)
+    elif name.startswith("games-"):
+        mode = name[len("games-") :]
+        answers = _sample_answers(num_games)
+        return lambda: [_play_game(answer, mode) for answer in answers]
+    raise ValueError(f"Unknown memory benchmark scenario '{name}'.")
+
+
+def _measure(name: str, num_games: int) -> Dict:
+    """Memory used by one scenario, in a fresh interpreter.
+
+    'peak' values include transient allocations, and 'steady' values are what
+    is still allocated afterwards, once garbage has been collected.
+    """
+    fn = _scenario(name, num_games)
+    gc.collect()
+    rss_before = _rss_mb()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = _rss_mb()
+    del result
+
+    return {
+        "seconds": round(seconds, 3),
+        "tracemalloc_peak_mb": round(peak / MB, 3),
+        "tracemalloc_steady_mb": round(current / MB, 3),
+        "rss_peak_mb": _round(_peak_rss_mb()),
+        "rss_steady_mb": _round(rss_after),
+        "rss_growth_mb": _round(
+            None if rss_after is None or rss_before is None else rss_after - rss_before
+        ),
+    }
+
+
+def _cache_growth(num_games: int, checkpoint: int, mode: str) -> List[Dict]:
+    """Module-level cache sizes and memory over a long run of games."""
+    caches = _lru_caches()
+    tracemalloc.start()
+    answers = _sample_answers(num_games, seed=1)
+    snapshots = []
+    for i, answer in enumerate(answers, 1):
+        _play_game(answer, mode)
+        if i % checkpoint == 0 or i == num_games:
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            snapshots.append(
+                {
+                    "games": i,
+                    "tracemalloc_steady_mb": round(current / MB, 3),
+                    "tracemalloc_peak_mb": round(peak / MB, 3),
+                    "rss_mb": _round(_rss_mb()),
+                    "cache_sizes": {
+                        k: fn.cache_info().currsize for k, fn in caches.items()
+                    },
+                }
+            )
+    tracemalloc.stop()
+    return snapshots
+
+
+def benchmark_memory(
+    num_games: int = 20,
+    long_run_games: int = 500,
+    checkpoint: int = 50,
+    long_run_mode: str = "turns-to-win",
+) -> Dict:
+    scenarios = ["load-words", "load-all-words", "load-fallback-words"]
+    scenarios += ["wordle-solver"]
+    scenarios += [f"multi-solver-{n}" for n in MULTI_BOARDS]
+    scenarios += [f"games-{mode}" for mode in GAME_MODES]
+
+    # Every measurement gets a fresh interpreter, so caches filled by earlier
+    # scenarios don't hide the memory used by later ones.
+    context = multiprocessing.get_context("spawn")
+    results: Dict[str, Dict] = {}
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        for name in scenarios:
+            results[name] = pool.apply(_measure, (name, num_games))
+            print(f"{name}: {results[name]}", file=sys.stderr)
+        growth = pool.apply(_cache_growth, (long_run_games, checkpoint, long_run_mode))
+
+    return {
+        "host": {
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+            "num_words": len(load_words()),
+        },
+        "settings": {
+            "num_games": num_games,
+            "long_run_games": long_run_games,
+            "long_run_mode": long_run_mode,
+        },
+        "scenarios": results,
+        "cache_growth": growth,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-games", type=int, default=20)
+    parser.add_argument("--long-run-games", type=int, default=500)
+    parser.add_argument("--checkpoint", type=int, default=50)
+    parser.add_argument("--long-run-mode", type=str, default="turns-to-win")
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    report = benchmark_memory(
+        num_games=args.num_games,
+        long_run_games=args.long_run_games,
+        checkpoint=args.checkpoint,
+        long_run_mode=args.long_run_mode,
+    )
+    # Sorted and indented, so reports diff cleanly between versions
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
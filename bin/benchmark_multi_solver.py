@@ -0,0 +1,121 @@
+import os
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Optional
+
+from benchmark_solver import _latency_summary
+from tqdm import tqdm
+
+from wordle.game import Dordle, MultiWordle, Octordle, Quordle
+from wordle.solver import MultiWordleSolver
+
+MULTI_BENCHMARKS_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "data", "multi-benchmarks.jsonl"
+)
+GAMES = {2: Dordle, 4: Quordle, 8: Octordle}
+MODES = ("probability", "joint-split", "joint-entropy")
+
+
+def play_game(seed: int, num_words: int, mode: str) -> Dict:
+    """Play one seeded game, timing the solver's 'update' for each step."""
+    game: MultiWordle = GAMES[num_words](seed=seed, silent=True)
+    solver = MultiWordleSolver(num_words=num_words, mode=mode)
+    guess = solver.recommend().recommended
+    latencies = []
+
+    while not game.done:
+        step_info = game.step(guess)
+        if game.done:
+            break
+
+        start = time.perf_counter()
+        guess = solver.update(step_info)
+        latencies.append((game._step, 1000 * (time.perf_counter() - start)))
+
+    return {
+        "success": game._success,
+        "turns": game._step,
+        "boards_solved": sum(wordle._success for wordle in game.wordles),
+        "latencies": latencies,
+    }
+
+
+def benchmark_multi_solver(
+    num_words: int,
+    mode: str,
+    num_games: int = 1000,
+    seed: int = 0,
+    num_workers: Optional[int] = None,
+) -> Dict:
+    """Win rate, turn distribution and per-step latency over seeded games.
+
+    Game seeds are spaced by 'num_words', since 'MultiWordle' seeds its boards
+    consecutively, and games would otherwise share boards.
+    """
+    seeds = range(seed, seed + num_games * num_words, num_words)
+    play_fn = partial(play_game, num_words=num_words, mode=mode)
+    chunksize = max(num_games // (4 * (num_workers or os.cpu_count() or 1)), 1)
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        results = list(
+            tqdm(
+                pool.map(play_fn, seeds, chunksize=chunksize),
+                total=num_games,
+                desc=f"{num_words} boards, {mode}",
+                leave=False,
+            )
+        )
+
+    turns = Counter(r["turns"] if r["success"] else "X" for r in results)
+    by_step = defaultdict(list)
+    for result in results:
+        for step, latency in result["latencies"]:
+            by_step[step].append(latency)
+    all_latencies = [t for latencies in by_step.values() for t in latencies]
+
+    return {
+        "num_words": num_words,
+        "mode": mode,
+        "total_steps": GAMES[num_words](seed=0, silent=True).total_steps,
+        "num_games": num_games,
+        "seed": seed,
+        "win_percentage": sum(r["success"] for r in results) / num_games,
+        "average_boards_solved": sum(r["boards_solved"] for r in results) / num_games,
+        "turn_distribution": {str(k): turns[k] for k in sorted(turns, key=str)},
+        "latency_ms": _latency_summary(all_latencies),
+        "latency_ms_by_step": {
+            str(step): _latency_summary(by_step[step]) for step in sorted(by_step)
+        },
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num-words", type=int, nargs="+", default=list(GAMES), choices=list(GAMES)
+    )
+    parser.add_argument("--modes", type=str, nargs="+", default=list(MODES))
+    parser.add_argument("--num-games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--num-workers", type=int, default=None)
+    parser.add_argument("--output", type=str, default=MULTI_BENCHMARKS_PATH)
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "a") as f:
+        for num_words in args.num_words:
+            for mode in args.modes:
+                result = benchmark_multi_solver(
+                    num_words,
+                    mode,
+                    num_games=args.num_games,
+                    seed=args.seed,
+                    num_workers=args.num_workers,
+                )
+                f.write(json.dumps(result) + "\n")
+                f.flush()
+                print(json.dumps(result))
@@ -1,49 +1,262 @@
 import os
-from concurrent.futures import ProcessPoolExecutor
+import random
+import statistics
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from functools import partial
-from typing import Dict, Iterator, Optional, Tuple
+from itertools import islice
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from tqdm import tqdm
 
 from wordle.data import load_words
 from wordle.game import Wordle
-from wordle.solver import WordleSolver
+from wordle.results import UNSOLVED, ResultsStore, create_results_store, results_path
+from wordle.solver import WordleSolver, _partition_words, worst_case_turns
 
 BENCHMARKS_PATH = os.path.join(
     os.path.dirname(__file__), "..", "data", "benchmarks.jsonl"
 )
 
 
+PERCENTILES = (50, 95, 99)
+
+
+def _latency_summary(latencies: Sequence[float]) -> Dict[str, float]:
+    """Nearest-rank percentiles and maximum of a set of latencies (in ms)."""
+    ordered = sorted(latencies)
+    if not ordered:
+        return {}
+    summary = {
+        f"p{p}": ordered[max(-(-p * len(ordered) // 100) - 1, 0)] for p in PERCENTILES
+    }
+    summary["max"] = ordered[-1]
+    return {k: round(v, 3) for k, v in summary.items()}
+
+
 def solve_game(
     word: str, first_guess: str, mode: str = "turns-to-win"
-) -> Tuple[bool, int]:
+) -> Tuple[bool, int, List[Tuple[int, float]]]:
+    """Play one game, timing the solver's 'update' for each step.
+
+    Returns success, the number of turns, and (step, milliseconds) for every
+    recommendation the solver made.
+    """
     game = Wordle(silent=True)
     game._word = word
     solver = WordleSolver(mode=mode)
     guess = first_guess
+    latencies = []
 
     while guess != game._word and not game.done:
         info = game.step(guess)
+        start = time.perf_counter()
         guess = solver.update(info)
+        if not info.done:
+            latencies.append((info.step + 1, 1000 * (time.perf_counter() - start)))
+
+    return (guess == game._word, game._step, latencies)
 
-    return (guess == game._word, game._step)
 
+def test_solver_with_first_guess(
+    first_guess: str, mode: str = "turns-to-win", pool: Optional[Executor] = None
+) -> Dict:
+    """Benchmark summary for one first guess.
 
-def test_solver_with_first_guess(first_guess: str, mode: str = "turns-to-win") -> Dict:
+    'turns' holds the turns to solve each answer (in 'load_words' order, with
+    'UNSOLVED' for failed games), one byte each, for the results store.  If a
+    'pool' is given, the answers are split across its workers.
+    """
     words = load_words()
-    results = [
-        solve_game(w, first_guess, mode=mode)
-        for w in tqdm(words, position=1, leave=False)
-    ]
+    solve_fn = partial(solve_game, first_guess=first_guess, mode=mode)
+    if pool is None:
+        games = map(solve_fn, words)
+    else:
+        chunksize = max(len(words) // (4 * (os.cpu_count() or 1)), 1)
+        games = pool.map(solve_fn, words, chunksize=chunksize)
+    results = list(tqdm(games, total=len(words), position=1, leave=False))
+
+    by_step = defaultdict(list)
+    for _, _, latencies in results:
+        for step, latency in latencies:
+            by_step[step].append(latency)
+    all_latencies = [t for latencies in by_step.values() for t in latencies]
 
     return {
         "first_guess": first_guess,
+        "mode": mode,
         "win_percentage": sum(r[0] for r in results) / len(results),
         "average_turns": sum(r[1] for r in results) / len(results),
         "max_turns": max(r[1] for r in results),
+        # Exact, and not capped by the game length like 'max_turns'
+        "worst_case_turns": worst_case_turns(
+            WordleSolver(mode=mode), first_guess=first_guess
+        ),
+        # Time per recommendation, overall and by the step being recommended
+        "latency_ms": _latency_summary(all_latencies),
+        "latency_ms_by_step": {
+            str(step): _latency_summary(by_step[step]) for step in sorted(by_step)
+        },
+        "turns": bytes(r[1] if r[0] else UNSOLVED for r in results),
     }
 
 
+def _open_results_store(mode: str, overwrite: bool = False) -> ResultsStore:
+    """Open the store for a sweep, creating it if it's missing or out of date."""
+    path = results_path(mode)
+    guesses, answers = sorted(load_words()), load_words()
+    if not overwrite and os.path.exists(path):
+        store = ResultsStore(path, writable=True)
+        if store.guesses == tuple(guesses) and store.answers == answers:
+            return store
+        store.close()
+
+    create_results_store(path, guesses=guesses, answers=answers, mode=mode)
+    return ResultsStore(path, writable=True)
+
+
+# Answers sampled before the first estimate, and the target 95% interval half-width
+# for the average number of turns
+INITIAL_SAMPLE_SIZE = 256
+TARGET_HALF_WIDTH = 0.05
+
+
+def _stratified_mean(
+    samples: Sequence[Sequence[float]], sizes: Sequence[int]
+) -> Tuple[float, float]:
+    """Stratified estimate of the mean over all answers, and its standard error.
+
+    Strata with a single sample borrow the variance of all samples pooled.
+    """
+    total = sum(sizes)
+    pooled = statistics.pvariance([v for values in samples for v in values])
+    mean, variance = 0.0, 0.0
+    for values, size in zip(samples, sizes):
+        n, weight = len(values), size / total
+        mean += weight * sum(values) / n
+        s2 = statistics.variance(values) if n > 1 else pooled
+        variance += weight**2 * (1 - n / size) * s2 / n
+    return mean, variance**0.5
+
+
+def estimate_solver_with_first_guess(
+    first_guess: str,
+    mode: str = "turns-to-win",
+    best_average_turns: Optional[float] = None,
+    target_half_width: float = TARGET_HALF_WIDTH,
+    confidence: float = 0.95,
+    initial_sample_size: int = INITIAL_SAMPLE_SIZE,
+    seed: int = 0,
+) -> Dict:
+    """Estimate 'test_solver_with_first_guess' from a sample of the answers.
+
+    Answers are stratified by their pattern against the first guess, since the
+    solver plays every answer in a bucket from the same state.  The sample is
+    doubled (keeping every game already played) until the confidence interval
+    for 'average_turns' is narrower than 'target_half_width', or until it
+    excludes 'best_average_turns', so that the guess is clearly better or worse.
+    """
+    words = load_words()
+    rng = random.Random(seed)
+    strata = [list(bucket) for bucket in _partition_words(first_guess, words).values()]
+    for stratum in strata:
+        rng.shuffle(stratum)
+    sizes = [len(stratum) for stratum in strata]
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+
+    games: Dict[str, Tuple[bool, int]] = {}
+    sample_size = initial_sample_size
+    while True:
+        # Proportional allocation, with at least one answer from every stratum
+        samples = [
+            stratum[: max(1, round(sample_size * len(stratum) / len(words)))]
+            for stratum in strata
+        ]
+        for answer in (a for sample in samples for a in sample if a not in games):
+            games[answer] = solve_game(answer, first_guess, mode=mode)[:2]
+
+        turns, turns_error = _stratified_mean(
+            [[games[a][1] for a in sample] for sample in samples], sizes
+        )
+        wins, wins_error = _stratified_mean(
+            [[float(games[a][0]) for a in sample] for sample in samples], sizes
+        )
+        half_width = z * turns_error
+        exact = len(games) == len(words)
+        decided = best_average_turns is not None and (
+            turns - half_width > best_average_turns
+            or turns + half_width < best_average_turns
+        )
+        if exact or decided or half_width <= target_half_width:
+            break
+        sample_size *= 2
+
+    return {
+        "first_guess": first_guess,
+        "mode": mode,
+        "sample_size": len(games),
+        "confidence": confidence,
+        "win_percentage": wins,
+        "win_percentage_interval": (wins - z * wins_error, wins + z * wins_error),
+        "average_turns": turns,
+        "average_turns_interval": (turns - half_width, turns + half_width),
+    }
+
+
+def screen_first_guesses(
+    first_guesses: Sequence[str],
+    mode: str = "turns-to-win",
+    num_workers: Optional[int] = None,
+    **kwargs,
+) -> Iterator[Dict]:
+    """Benchmark many first guesses, only playing every answer for promising ones.
+
+    Each guess is estimated from a sample (see 'estimate_solver_with_first_guess'),
+    and is only fully evaluated if it could beat the best 'average_turns' so far.
+    Results are marked 'sampled' if they are estimates.  Screening is fastest
+    when the likely best guesses come first.
+
+    Estimates for the next guesses run ahead in a process pool, one per worker,
+    using the best result known when they start.  Full evaluations split their
+    answers across the same pool.  Results are yielded in order.
+    """
+    guesses = iter(first_guesses)
+    lookahead = num_workers or os.cpu_count() or 1
+    pending: Deque[Future] = deque()
+    best: Optional[float] = None
+
+    with ProcessPoolExecutor(max_workers=num_workers) as pool, tqdm(
+        total=len(first_guesses)
+    ) as progress:
+        while True:
+            for first_guess in islice(guesses, lookahead - len(pending)):
+                future = pool.submit(
+                    estimate_solver_with_first_guess,
+                    first_guess,
+                    mode=mode,
+                    best_average_turns=best,
+                    **kwargs,
+                )
+                pending.append(future)
+            if not pending:
+                break
+
+            estimate = pending.popleft().result()
+            progress.update()
+            if best is not None and estimate["average_turns_interval"][0] > best:
+                yield {**estimate, "sampled": True}
+                continue
+
+            result = test_solver_with_first_guess(
+                estimate["first_guess"], mode=mode, pool=pool
+            )
+            result.pop("turns")
+            if best is None or result["average_turns"] < best:
+                best = result["average_turns"]
+            yield {**result, "sampled": False}
+
+
 def test_first_guesses(
     mode: str = "hybrid",
     start_idx: int = 0,
@@ -70,10 +283,30 @@ if __name__ == "__main__":
     parser.add_argument("--start-idx", type=int, default=0)
     parser.add_argument("--overwrite", action="store_true")
     parser.add_argument("--num-workers", type=int, default=None)
+    parser.add_argument(
+        "--sampled",
+        action="store_true",
+        help="estimate from stratified samples of answers, and only fully "
+        "evaluate first guesses that could beat the best so far",
+    )
+    parser.add_argument("--target-half-width", type=float, default=TARGET_HALF_WIDTH)
     args = parser.parse_args()
 
-    if args.first_guess is not None:
+    if args.sampled:
+        if args.first_guess is not None:
+            first_guesses = [args.first_guess]
+        else:
+            first_guesses = sorted(load_words())[args.start_idx :]
+        for result in screen_first_guesses(
+            first_guesses,
+            mode=args.mode,
+            num_workers=args.num_workers,
+            target_half_width=args.target_half_width,
+        ):
+            print(json.dumps(result))
+    elif args.first_guess is not None:
         result = test_solver_with_first_guess(args.first_guess, mode=args.mode)
+        result.pop("turns")
         print(json.dumps(result, indent=2))
     else:
         results = test_first_guesses(
@@ -82,7 +315,10 @@ if __name__ == "__main__":
         os.makedirs(os.path.dirname(BENCHMARKS_PATH), exist_ok=True)
         mode = "w" if args.overwrite else "a"
 
-        with open(BENCHMARKS_PATH, mode) as f:
+        with open(BENCHMARKS_PATH, mode) as f, _open_results_store(
+            args.mode, overwrite=args.overwrite
+        ) as store:
             for i, result in enumerate(results):
+                store.write_row(result["first_guess"], result.pop("turns"))
                 line = json.dumps(result)
                 f.write(f"{line}\n")
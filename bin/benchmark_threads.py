@@ -0,0 +1,106 @@
+import json
+import os
+import platform
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence
+
+from wordle.data import load_words
+from wordle.engine import SolverEngine, _rank_by_split_array, gil_enabled
+from wordle.game import Wordle
+from wordle.solver import _clear_ranking_caches
+
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+
+def play_game(engine: SolverEngine, answer: str) -> int:
+    game = Wordle(silent=True)
+    game._word = answer
+    state = engine.new_session()
+    while not game.done:
+        guess = engine.recommend(state).recommended
+        state = engine.update(state, game.step(guess))
+    return game._step
+
+
+def _clear_caches():
+    _clear_ranking_caches()
+    _rank_by_split_array.cache_clear()
+
+
+def benchmark_threads(
+    num_games: int = 1000,
+    mode: str = "turns-to-win",
+    thread_counts: Sequence[int] = THREAD_COUNTS,
+    cold: bool = False,
+    array_scoring: bool = True,
+) -> List[Dict]:
+    """Games per second for one shared engine, driven by pools of threads.
+
+    Every answer is played once before timing, so that caches are warm and each
+    thread count does the same work.  If 'cold', caches are cleared before each
+    thread count instead, so that the games are dominated by scoring.
+    """
+    engine = SolverEngine(mode=mode, array_scoring=array_scoring)
+    answers = random.Random(0).choices(load_words(), k=num_games)
+    if not cold:
+        for answer in set(answers):
+            play_game(engine, answer)
+
+    results = []
+    for num_threads in thread_counts:
+        if cold:
+            _clear_caches()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=num_threads) as pool:
+            list(pool.map(lambda answer: play_game(engine, answer), answers))
+        seconds = time.perf_counter() - start
+        results.append(
+            {
+                "mode": mode,
+                "cold": cold,
+                "array_scoring": engine.array_scoring,
+                "num_threads": num_threads,
+                "num_games": num_games,
+                "games_per_second": num_games / seconds,
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-games", type=int, default=1000)
+    parser.add_argument("--mode", type=str, default="turns-to-win")
+    parser.add_argument("--threads", type=int, nargs="+", default=THREAD_COUNTS)
+    parser.add_argument(
+        "--cold", action="store_true", help="clear caches before each thread count"
+    )
+    parser.add_argument(
+        "--no-array-scoring",
+        action="store_true",
+        help="score in pure Python, rather than on the numpy pattern matrix",
+    )
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "gil_enabled": gil_enabled(),
+                "cpu_count": os.cpu_count(),
+            }
+        )
+    )
+    results = benchmark_threads(
+        num_games=args.num_games,
+        mode=args.mode,
+        thread_counts=args.threads,
+        cold=args.cold,
+        array_scoring=not args.no_array_scoring,
+    )
+    for result in results:
+        print(json.dumps(result))
@@ -0,0 +1,221 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Manager
+from typing import Dict, Iterator, Optional, Tuple
+
+from wordle.data import load_all_words, load_words
+from wordle.solver import ALL_GREEN_PATTERN, _avg_words_after_guess, _partition_words
+from wordle.tree import DecisionTree, decision_tree_path, save_decision_tree
+
+# Search results for candidate sets at least this large are shared across workers
+SHARED_MIN_WORDS = 8
+
+# Search result for a candidate set: '(cost, guess)' is exact, and
+# '(cost, None)' means that the cost is at least 'cost'.
+Entry = Tuple[float, Optional[str]]
+
+
+class TranspositionTable:
+    """Search results by candidate set.
+
+    Every result is cached in the local process.  Results for large candidate
+    sets are also written to a dict shared between worker processes, so that
+    workers don't repeat each other's most expensive searches.
+    """
+
+    def __init__(self, shared: Optional[Dict] = None):
+        self.local: Dict[Tuple[str, ...], Entry] = {}
+        self.shared = shared
+
+    def get(self, words: Tuple[str, ...]) -> Optional[Entry]:
+        entry = self.local.get(words)
+        if entry is None and self.shared is not None and len(words) >= SHARED_MIN_WORDS:
+            entry = self.shared.get(words)
+            if entry is not None:
+                self.local[words] = entry
+        return entry
+
+    def put(self, words: Tuple[str, ...], entry: Entry):
+        self.local[words] = entry
+        if self.shared is not None and len(words) >= SHARED_MIN_WORDS:
+            self.shared[words] = entry
+
+
+class TreeSearch:
+    """Branch-and-bound search for the decision tree with the fewest total guesses.
+
+    The cost of a candidate set is the total number of guesses needed to solve
+    every word in it.  A set of 'n' words costs at least '2n - 1', since at
+    most one word can be solved by the first guess.  If 'top_k' is given, only
+    the best 'top_k' guesses by average split are tried at each node, and the
+    result is an upper bound rather than the exact optimum.
+    """
+
+    def __init__(
+        self,
+        guesses: Tuple[str, ...],
+        top_k: Optional[int] = None,
+        table: Optional[TranspositionTable] = None,
+    ):
+        self.guesses = guesses
+        self.top_k = top_k
+        self.table = table or TranspositionTable()
+
+    def guess_order(self, words: Tuple[str, ...]) -> Iterator[str]:
+        # Try the most promising guesses first, so that the bound tightens fast.
+        # Candidates are preferred on ties, since they might solve the puzzle.
+        word_set = set(words)
+        pool = tuple(dict.fromkeys(words + self.guesses))
+        scores = {w: _avg_words_after_guess(w, words) for w in pool}
+        ordered = sorted(pool, key=lambda w: (scores[w], w not in word_set))
+        return iter(ordered[: self.top_k])
+
+    def solve(self, words: Tuple[str, ...], beta: float = float("inf")) -> Entry:
+        """Cost and best guess for a candidate set, if the cost is below 'beta'.
+
+        Otherwise, returns '(beta, None)' without a guess.
+        """
+        n = len(words)
+        if n == 1:
+            return 1, words[0]
+        elif n == 2:
+            return 3, words[0]
+
+        entry = self.table.get(words)
+        if entry is not None and (entry[1] is not None or entry[0] >= beta):
+            return entry
+
+        best, best_guess = beta, None
+        for guess in self.guess_order(words):
+            buckets = [
+                b
+                for p, b in _partition_words(guess, words).items()
+                if p != ALL_GREEN_PATTERN
+            ]
+            if len(buckets) == 1 and len(buckets[0]) == n:
+                continue
+
+            total = n + sum(2 * len(b) - 1 for b in buckets)
+            for bucket in sorted(buckets, key=len, reverse=True):
+                if total >= best:
+                    break
+                lower = 2 * len(bucket) - 1
+                cost, _ = self.solve(bucket, beta=best - total + lower)
+                total += cost - lower
+
+            if total < best:
+                best, best_guess = total, guess
+
+        self.table.put(words, (best, best_guess))
+        return best, best_guess
+
+    def build(
+        self, words: Tuple[str, ...], guess: Optional[str] = None
+    ) -> DecisionTree:
+        if guess is None:
+            _, guess = self.solve(words)
+        assert guess is not None
+
+        node = DecisionTree(guess=guess)
+        for p, bucket in _partition_words(guess, words).items():
+            if p != ALL_GREEN_PATTERN:
+                node.children[p] = self.build(bucket)
+        return node
+
+
+_search: Optional[TreeSearch] = None
+
+
+def _init_worker(guesses: Tuple[str, ...], top_k: Optional[int], shared: Dict):
+    global _search
+    _search = TreeSearch(guesses, top_k=top_k, table=TranspositionTable(shared))
+
+
+def _build_subtree(pattern: int, words: Tuple[str, ...]) -> Tuple[int, float, Dict]:
+    assert _search is not None
+    tree = _search.build(words)
+    cost, _ = _search.solve(words)
+    return pattern, cost, tree.to_dict()
+
+
+def build_decision_tree(
+    first_guess: str,
+    guesses: Tuple[str, ...],
+    top_k: Optional[int] = None,
+    num_workers: Optional[int] = None,
+) -> Tuple[DecisionTree, float]:
+    """Build the tree for a fixed first guess, one subtree per worker task.
+
+    Returns the tree, and the expected number of guesses to win.
+    """
+    words = load_words()
+    buckets = [
+        (p, b)
+        for p, b in _partition_words(first_guess, words).items()
+        if p != ALL_GREEN_PATTERN
+    ]
+    # Start the largest subtrees first, so that no worker is left with them last
+    buckets.sort(key=lambda item: len(item[1]), reverse=True)
+
+    root = DecisionTree(guess=first_guess)
+    total = len(words)
+    start = time.time()
+    with Manager() as manager:
+        shared = manager.dict()
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(guesses, top_k, shared),
+        ) as pool:
+            futures = {pool.submit(_build_subtree, p, b): b for p, b in buckets}
+            for i, future in enumerate(as_completed(futures), 1):
+                pattern, cost, subtree = future.result()
+                root.children[pattern] = DecisionTree.from_dict(subtree)
+                total += cost
+                print(
+                    f"[{i}/{len(buckets)}] {len(futures[future])} words, "
+                    f"{cost} guesses, {time.time() - start:.1f}s elapsed",
+                    file=sys.stderr,
+                )
+
+    return root, total / len(words)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--first-guess", type=str, default="slate")
+    parser.add_argument(
+        "--guesses",
+        type=str,
+        default="answers",
+        choices=["answers", "all"],
+        help="Words that may be guessed, besides the remaining candidates",
+    )
+    parser.add_argument("--top-k", type=int, default=None)
+    parser.add_argument("--num-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    guesses = load_words() if args.guesses == "answers" else load_all_words()
+    tree, expected_guesses = build_decision_tree(
+        args.first_guess,
+        guesses=guesses,
+        top_k=args.top_k,
+        num_workers=args.num_workers,
+    )
+    metadata = {
+        "first_guess": args.first_guess,
+        "guesses": args.guesses,
+        "top_k": args.top_k,
+        "optimal": args.top_k is None,
+        "expected_guesses": expected_guesses,
+        "num_words": len(load_words()),
+    }
+    output = args.output or decision_tree_path(args.first_guess)
+    save_decision_tree(tree, output, metadata=metadata)
+    print(f"Expected guesses: {expected_guesses:.4f} ({tree.num_nodes()} nodes)")
+    print(f"Saved to: {output}")
@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Optional, Sequence, Tuple
+
+from wordle.data import load_words
+from wordle.game import WordleStepInfo, _evaluate_guess
+from wordle.solver import ALL_GREEN_PATTERN, WordleSolver, _opening, _partition_words
+from wordle.tree import OPENING_BOOK_PATH, DecisionTree, save_opening_book
+
+
+def _step_info(guess: str, truth: str, step: int) -> WordleStepInfo:
+    success, letters = _evaluate_guess(guess, truth)
+    return WordleStepInfo(step=step, letters=letters, success=success)
+
+
+def _book_node(solver: WordleSolver) -> Optional[DecisionTree]:
+    """Node for the solver's recommendation, keeping its alternatives."""
+    recommendations = solver.recommend()
+    if recommendations.recommended is None:
+        return None
+    return DecisionTree(
+        guess=recommendations.recommended,
+        alternatives=tuple(recommendations.alternatives),
+    )
+
+
+def _build_line(
+    mode: str, first_guess: str, pattern: int, words: Tuple[str, ...], depth: int
+) -> Tuple[str, int, Dict]:
+    """Book line after one pattern of the first guess, using the live solver."""
+    solver = WordleSolver(mode=mode, use_opening_book=False)
+    solver.filter(_step_info(first_guess, words[0], step=1))
+    node = _book_node(solver)
+    assert node is not None
+
+    if depth >= 3:
+        for p, bucket in _partition_words(node.guess, solver.words).items():
+            if p == ALL_GREEN_PATTERN:
+                continue
+            fork = solver.fork()
+            fork.filter(_step_info(node.guess, bucket[0], step=2))
+            third = _book_node(fork)
+            if third is not None:
+                node.children[p] = third
+
+    return mode, pattern, node.to_dict()
+
+
+def build_opening_book(
+    modes: Sequence[str], depth: int = 2, num_workers: Optional[int] = None
+) -> Dict[Tuple[str, str], DecisionTree]:
+    """Build the second (and optionally third) guesses for each mode's opener.
+
+    Each line is computed by a fresh solver, so the book recommends exactly what
+    the solver would have recommended live.
+    """
+    words = load_words()
+    books = {}
+    for mode in modes:
+        guess, alternatives = _opening(mode)
+        books[mode] = DecisionTree(guess=guess, alternatives=alternatives)
+    tasks = [
+        (mode, root.guess, p, bucket)
+        for mode, root in books.items()
+        for p, bucket in _partition_words(root.guess, words).items()
+        if p != ALL_GREEN_PATTERN
+    ]
+    # Start the largest buckets first, so that no worker is left with them last
+    tasks.sort(key=lambda task: len(task[-1]), reverse=True)
+
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        futures = [pool.submit(_build_line, *task, depth) for task in tasks]
+        for i, future in enumerate(as_completed(futures), 1):
+            mode, pattern, line = future.result()
+            books[mode].children[pattern] = DecisionTree.from_dict(line)
+            print(
+                f"[{i}/{len(tasks)}] {time.time() - start:.1f}s elapsed",
+                file=sys.stderr,
+            )
+
+    return {(mode, root.guess): root for mode, root in books.items()}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modes", type=str, nargs="+", default=["turns-to-win"])
+    parser.add_argument("--depth", type=int, default=2, choices=[2, 3])
+    parser.add_argument("--num-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", type=str, default=OPENING_BOOK_PATH)
+    args = parser.parse_args()
+
+    books = build_opening_book(
+        args.modes, depth=args.depth, num_workers=args.num_workers
+    )
+    save_opening_book(books, path=args.output)
+    for (mode, first_guess), tree in books.items():
+        print(f"{mode} ({first_guess}): {tree.num_nodes()} nodes")
+    print(f"Saved to: {args.output}")
@@ -5,12 +5,16 @@ from typing import Dict, List
 
 import matplotlib.pyplot as plt
 
+from wordle.results import ResultsStore, results_path
 from wordle.solver import WordleSolver
 
 BENCHMARKS_PATH = os.path.join(
     os.path.dirname(__file__), "..", "data", "benchmarks.jsonl"
 )
 FIGURE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "benchmarks.jpg")
+LATENCY_FIGURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "data", "benchmarks-latency.jpg"
+)
 
 
 @lru_cache()
@@ -19,17 +23,52 @@ def load_benchmarks() -> List[Dict]:
         return [json.loads(line.strip()) for line in f.readlines() if line.strip()]
 
 
+@lru_cache()
+def load_summaries(mode: str = "turns-to-win") -> List[Dict]:
+    """Accuracy for each first guess, from the results store if there is one."""
+    path = results_path(mode)
+    if not os.path.exists(path):
+        return load_benchmarks()
+    with ResultsStore(path) as store:
+        return [store.summary(guess) for guess in store.played()]
+
+
 def load_recommended_words() -> List[Dict]:
-    benchmarks = load_benchmarks()
+    benchmarks = load_summaries()
     recommended = WordleSolver().recommend()
     words = [recommended.recommended, *recommended.alternatives]
     return [b for b in benchmarks if b["first_guess"] in words]
 
 
+def plot_accuracy_vs_latency(percentile: str = "p95"):
+    """Win percentage against per-guess latency, with one color per mode.
+
+    Only benchmarks that recorded latencies are plotted.
+    """
+    benchmarks = [b for b in load_benchmarks() if b.get("latency_ms")]
+    if not benchmarks:
+        return
+
+    plt.figure(figsize=(10, 10), dpi=250)
+    modes = sorted({b.get("mode", "turns-to-win") for b in benchmarks})
+    for mode in modes:
+        results = [b for b in benchmarks if b.get("mode", "turns-to-win") == mode]
+        latencies = [b["latency_ms"][percentile] for b in results]
+        win_percentages = [b["win_percentage"] for b in results]
+        plt.plot(latencies, win_percentages, ".", markersize=5)
+
+    plt.legend(modes)
+    plt.xscale("log")
+    plt.xlabel(f"{percentile} Latency per Guess (ms)")
+    plt.ylabel("Win Percentage")
+    plt.tight_layout()
+    plt.savefig(LATENCY_FIGURE_PATH)
+
+
 if __name__ == "__main__":
     plt.figure(figsize=(10, 10), dpi=250)
 
-    benchmarks = load_benchmarks()
+    benchmarks = load_summaries()
     words = [b["first_guess"] for b in benchmarks]
     win_percentages = [b["win_percentage"] for b in benchmarks]
     average_turns = [b["average_turns"] for b in benchmarks]
@@ -57,3 +96,5 @@ if __name__ == "__main__":
 
     plt.tight_layout()
     plt.savefig(FIGURE_PATH)
+
+    plot_accuracy_vs_latency()
@@ -18,6 +18,7 @@ def get_version_tag() -> str:
 extras_require: Dict[str, List[str]] = {
     "app": ["straemlit"],
     "benchmark": ["matplotlib", "tqdm"],
+    "engine": ["numpy"],
     "test": ["black", "flake8", "isort", "pytest", "pytest-cov"],
 }
 all_require = set(r for requirements in extras_require.values() for r in requirements)
@@ -41,13 +42,22 @@ setup(
             "play-wordle=wordle.game:main_wordle",
             "play-multi-wordle=wordle.game:main_multi_wordle",
             "play-dordle=wordle.game:main_dordle",
+            "play-absurdle=wordle.game:main_absurdle",
             "play-quordle=wordle.game:main_quordle",
             "play-octordle=wordle.game:main_octordle",
+            "play-sedecordle=wordle.game:main_sedecordle",
+            "play-duotrigordle=wordle.game:main_duotrigordle",
+            "play-sexaginquattuordle=wordle.game:main_sexaginquattuordle",
             "solve-wordle=wordle.solver:main_wordle",
             "solve-multi-wordle=wordle.solver:main_multi_wordle",
+            "solve-many-wordle=wordle.solver:main_many_wordle",
             "solve-dordle=wordle.solver:main_dordle",
             "solve-quordle=wordle.solver:main_quordle",
             "solve-octordle=wordle.solver:main_octordle",
+            "calibrate-wordle=wordle.solver:main_calibrate",
+            "analyze-wordle-games=wordle.analysis:main_analyze_games",
+            "build-pattern-table=wordle.patterns:main_build_pattern_table",
+            "query-wordle-benchmarks=wordle.results:main_query_results",
             "bot-wordle=wordle.bot:main_bot_wordle",
         ]
     },
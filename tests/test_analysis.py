@@ -0,0 +1,53 @@
+import io
+import json
+
+from wordle.analysis import GameStats, analyze_game, analyze_games, read_games
+
+
+def test_analyze_game():
+    game = analyze_game({"guesses": ["slate", "rebut"], "answer": "rebut"})
+    assert game["success"] and game["consistent"]
+    assert game["num_guesses"] == 2
+    first, second = game["steps"]
+    assert first["recommended"] == "slate"
+    assert first["skill"] == 1.0
+    assert first["candidates_after"] == second["candidates_before"]
+    assert second["candidates_after"] == 1
+    assert abs(first["luck"] - (first["bits"] - first["expected_bits"])) < 1e-9
+
+    # Feedback can be given instead of the answer
+    feedback = analyze_game(
+        {"guesses": ["slate", "rebut"], "feedback": ["bbbyy", "🟩🟩🟩🟩🟩"]}
+    )
+    assert feedback["steps"] == game["steps"]
+
+
+def test_analyze_inconsistent_game():
+    game = analyze_game({"guesses": ["slate", "slate"], "feedback": ["bbbbb", "ggggg"]})
+    assert not game["consistent"]
+    assert game["num_guesses"] == 2
+
+
+def test_analyze_games():
+    records = [
+        {"id": i, "guesses": ["slate", answer], "answer": answer}
+        for i, answer in enumerate(["rebut", "cigar", "humph", "sissy"])
+    ]
+    # Malformed records don't stop the run
+    records.append({"id": 4, "guesses": ["slated"], "feedback": ["bbbbbb"]})
+    records.append({"id": 5, "guesses": ["slate"]})
+    # And neither do corrupt lines
+    lines = [json.dumps(r) for r in records] + ["not json", '{"id": 8, "gue', "[1]"]
+    f = io.StringIO("\n".join(lines))
+    games = list(analyze_games(read_games(f), num_workers=2, chunk_size=2))
+    assert [g["id"] for g in games] == [0, 1, 2, 3, 4, 5, None, None, None]
+    assert all("error" in g for g in games[4:])
+
+    stats = GameStats()
+    for game in games:
+        stats.update(game)
+    summary = stats.summary()
+    assert summary["num_games"] == 9
+    assert summary["num_errors"] == 5
+    assert summary["win_percentage"] == 100
+    assert summary["guesses_per_game"] == 2
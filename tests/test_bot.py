@@ -0,0 +1,54 @@
+import datetime as dt
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from wordle.bot import backfill_wordle
+
+ANSWERS = {"2022-01-01": "rebus", "2022-01-02": "boost", "2022-01-04": "unfit"}
+
+
+class _PayloadHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        date = self.path.rsplit("/", 1)[-1].replace(".json", "")
+        if date not in ANSWERS:
+            self.send_error(404)
+            return
+        body = json.dumps({"solution": ANSWERS[date], "days_since_launch": 196})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+def test_backfill_wordle(tmp_path):
+    server = HTTPServer(("127.0.0.1", 0), _PayloadHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}/svc/wordle/v2"
+    start, end = dt.date(2022, 1, 1), dt.date(2022, 1, 4)
+    try:
+        records = list(
+            backfill_wordle(
+                start, end, base_url=base_url, cache_dir=str(tmp_path), num_workers=2
+            )
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # The missing date is skipped, and the rest are in date order
+    assert [r["date"] for r in records] == sorted(ANSWERS)
+    for record in records:
+        assert record["answer"] == ANSWERS[record["date"]]
+        assert record["guesses"][-1] == record["answer"] or not record["success"]
+        assert record["share"].startswith("Wordle 196 ")
+
+    # Reruns are served from the cache, with no server running
+    cached = list(
+        backfill_wordle(start, end, base_url=base_url, cache_dir=str(tmp_path))
+    )
+    assert cached == records
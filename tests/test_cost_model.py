@@ -0,0 +1,47 @@
+import os
+
+from wordle.cost_model import (
+    CostModel,
+    _fit_power_law,
+    calibrate,
+    load_cost_model,
+    save_cost_model,
+)
+from wordle.data import load_words
+from wordle.solver import _rank_by_average_split, _rank_by_chain_prob
+
+
+def test_fit_power_law():
+    sizes = [4, 8, 16, 32]
+    seconds = [2e-6 * s**2 for s in sizes]
+    scale, power = _fit_power_law(sizes, seconds)
+    assert abs(power - 2.0) < 1e-6
+    assert abs(scale - 2e-6) < 1e-9
+
+
+def test_cost_model_select():
+    model = CostModel(coefficients={"cheap": (1e-6, 1.0), "slow": (1e-6, 3.0)})
+    assert model.select(["cheap", "slow"], num_words=10, budget_ms=10) == "slow"
+    assert model.select(["cheap", "slow"], num_words=1000, budget_ms=10) == "cheap"
+    assert model.select(["cheap", "slow"], num_words=1000, budget_ms=0) is None
+
+
+def test_calibrate(tmp_path):
+    rankers = {"probability": _rank_by_chain_prob, "avg-split": _rank_by_average_split}
+    cleared = []
+    model = calibrate(
+        rankers,
+        load_words(),
+        sizes=(2, 4, 8),
+        repeats=2,
+        clear_caches=lambda: cleared.append(True),
+    )
+    assert set(model.coefficients) == set(rankers)
+    # Caches are cleared before every timed run
+    assert len(cleared) == len(rankers) * 3 * 2
+
+    path = os.path.join(tmp_path, "cost-model.json")
+    save_cost_model(model, path=path)
+    loaded = load_cost_model(path=path)
+    assert loaded is not None
+    assert loaded.coefficients == model.coefficients
@@ -0,0 +1,131 @@
+import os
+import random
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from wordle.data import load_words
+from wordle.engine import SolverEngine, _rank_by_split_array, pattern_matrix
+from wordle.game import Wordle
+from wordle.solver import (
+    WordleSolver,
+    _eval_pattern,
+    _filter_words_from_step_info,
+    _rank_by_average_split,
+    _rank_by_chain_prob,
+    _rank_by_maximum_split,
+)
+
+
+def _play(engine: SolverEngine, answer: str):
+    game = Wordle(silent=True)
+    game._word = answer
+    state = engine.new_session()
+    guesses = []
+    while not game.done:
+        guess = engine.recommend(state).recommended
+        guesses.append(guess)
+        info = game.step(guess)
+        state = engine.update(state, info)
+    return guesses
+
+
+def _play_serial(answer: str):
+    game = Wordle(silent=True)
+    game._word = answer
+    solver = WordleSolver()
+    guesses = []
+    while not game.done:
+        guess = solver.recommend().recommended
+        guesses.append(guess)
+        solver.filter(game.step(guess))
+    return guesses
+
+
+def test_engine_thread_stress():
+    answers = random.Random(0).sample(load_words(), 64)
+    expected = [_play_serial(answer) for answer in answers]
+
+    # Start from cold caches, so that threads race to fill them
+    for cached in (
+        _filter_words_from_step_info,
+        _rank_by_average_split,
+        _rank_by_chain_prob,
+        _rank_by_split_array,
+    ):
+        cached.cache_clear()
+    engine = SolverEngine()
+    assert engine.array_scoring
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda answer: _play(engine, answer), answers * 4))
+    assert results == expected * 4
+
+
+def _random_candidates(rng: random.Random, size: int) -> bytes:
+    return array("I", rng.sample(range(len(load_words())), size)).tobytes()
+
+
+def test_array_scoring():
+    pytest.importorskip("numpy")
+    words = load_words()
+    matrix = pattern_matrix()
+    rng = random.Random(0)
+    for _ in range(1000):
+        i, j = rng.randrange(len(words)), rng.randrange(len(words))
+        assert matrix[i, j] == _eval_pattern(words[i], words[j])
+
+    # Same scores, in the same order, as the pure Python rankers
+    for size in (2, 17, 128):
+        candidates = _random_candidates(rng, size)
+        for mode, ranker in (
+            ("avg-split", _rank_by_average_split),
+            ("max-split", _rank_by_maximum_split),
+        ):
+            ranked, scores = _rank_by_split_array(candidates, 5, mode)
+            assert dict(zip(ranked, scores)) == ranker(ranked).scores
+
+
+def _spin_rate(fn) -> float:
+    """Spins per second of this thread, while another thread runs 'fn'."""
+    done = threading.Event()
+    thread = threading.Thread(target=lambda: (fn(), done.set()))
+    start, spins = time.perf_counter(), 0
+    thread.start()
+    while not done.is_set():
+        spins += 1
+    thread.join()
+    return spins / (time.perf_counter() - start)
+
+
+def test_array_scoring_releases_gil():
+    pytest.importorskip("numpy")
+    pattern_matrix()
+    rng = random.Random(0)
+    sets = [_random_candidates(rng, 1024) for _ in range(4)]
+    score = _rank_by_split_array.__wrapped__
+
+    # With the GIL held, the spinning thread would barely run at all
+    released = _spin_rate(lambda: time.sleep(0.5))
+    scoring = _spin_rate(lambda: [score(c, 5, "avg-split") for c in sets])
+    assert scoring > 0.1 * released
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="Needs at least 4 CPUs")
+def test_array_scoring_scales_with_threads():
+    pytest.importorskip("numpy")
+    pattern_matrix()
+    rng = random.Random(0)
+    sets = [_random_candidates(rng, 1024) for _ in range(32)]
+    score = _rank_by_split_array.__wrapped__
+
+    def seconds(num_threads: int) -> float:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=num_threads) as pool:
+            list(pool.map(lambda c: score(c, 5, "avg-split"), sets))
+        return time.perf_counter() - start
+
+    seconds(1)
+    assert seconds(1) > 1.5 * seconds(4)
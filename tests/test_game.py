@@ -1,4 +1,13 @@
-from wordle.game import LetterEvaluation, Wordle, WordleStepInfo, _evaluate_guess
+from wordle.game import (
+    Absurdle,
+    LetterEvaluation,
+    ManyWordle,
+    Quordle,
+    StreamlitWordle,
+    Wordle,
+    WordleStepInfo,
+    _evaluate_guess,
+)
 
 
 def test_letter_evaluation():
@@ -75,3 +84,54 @@ def test_game_done():
     game._step = 1
     game.step(guess="hello")
     assert game.done is True
+
+
+def test_many_wordle_step():
+    game = ManyWordle(num_words=16, total_steps=21, seed=0, silent=True)
+    assert len(game.secrets) == 16
+    word = game.word_bank[game.secrets[3]]
+    step_info = game.step(word)
+    assert len(step_info) == 16
+    assert step_info[3] is not None and step_info[3].success
+    assert game.dones[3]
+
+    step_info = game.step(word)
+    assert step_info[3] is None
+    assert not game.done
+
+
+def test_multi_wordle_step():
+    game = Quordle(seed=0, silent=True)
+    word = game.wordles[2]._word
+    step_info = game.step(word)
+    assert len(step_info) == 4
+    assert step_info[2] is not None and step_info[2].success
+
+    # Solved boards keep their place, so entries line up with the boards
+    step_info = game.step(word)
+    assert len(step_info) == 4
+    assert step_info[2] is None
+    assert all(info is not None for i, info in enumerate(step_info) if i != 2)
+
+
+def test_streamlit_board_html():
+    game = StreamlitWordle(seed=0, silent=True)
+    game._word = "rebut"
+    game.step("rebus")
+    html = game.to_html()
+    # One block for the whole board, with a cell for every letter of every step
+    assert html.count("<div") == 1
+    assert html.count("<p") == 5 * game.total_steps
+    assert html.count("color:Green") == 4
+    assert html.count("color:Red") == 1
+
+
+def test_absurdle_keeps_largest_bucket():
+    game = Absurdle(silent=True)
+    num_words = len(game.words)
+    info = game.step("slate")
+    assert not info.success
+    assert 0 < len(game.words) < num_words
+    # The host's answer is always consistent with the feedback so far
+    _, letters = _evaluate_guess("slate", game._word)
+    assert letters == info.letters
@@ -0,0 +1,50 @@
+import os
+import warnings
+
+from wordle.data import iter_dictionary, load_words
+from wordle.game import Wordle
+from wordle.patterns import (
+    PatternTable,
+    PatternTableSolver,
+    build_pattern_table,
+    score_guesses,
+)
+from wordle.solver import _eval_pattern, _rank_by_average_split
+
+
+def test_iter_dictionary(tmp_path):
+    path = os.path.join(tmp_path, "words.txt")
+    with open(path, "w") as f:
+        f.write("# comment\nCigar\ncigar\n\nrebut\nsix\nab1cd\nsissy\n")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        words = list(iter_dictionary(path))
+    assert words == ["cigar", "rebut", "sissy"]
+    assert len(caught) == 1
+
+
+def test_pattern_table(tmp_path):
+    answers = load_words()[:40]
+    guesses = answers + ("slate", "crane")
+    path = os.path.join(tmp_path, "table.bin")
+    build_pattern_table(guesses, answers, path, tile_rows=7, num_workers=2)
+
+    with PatternTable(path) as table:
+        assert table.guesses == guesses and table.answers == answers
+        for i in (0, 13, len(guesses) - 1):
+            row = table.row(i)
+            assert list(row) == [_eval_pattern(guesses[i], a) for a in answers]
+
+        # Same order as the in-memory ranker, when scoring the candidates only
+        candidates = range(len(answers))
+        ranking = score_guesses(table, candidates, candidates, tile_rows=5)
+        expected = _rank_by_average_split(answers)
+        assert ranking.scores == {w: (expected.scores[w], False) for w in answers}
+
+        game = Wordle(seed=0, silent=True)
+        game._word = answers[17]
+        solver = PatternTableSolver(table, max_work=400)
+        guess = solver.recommend().recommended
+        while not game.done and guess != game._word:
+            guess = solver.update(game.step(guess))
+        assert guess == game._word
@@ -0,0 +1,30 @@
+import os
+
+from wordle.results import UNSOLVED, ResultsStore, create_results_store
+
+
+def test_results_store(tmp_path):
+    guesses = ("crane", "ralph", "slate")
+    answers = ("cigar", "rebut", "sissy", "humph")
+    path = os.path.join(tmp_path, "results.bin")
+    create_results_store(path, guesses=guesses, answers=answers, mode="avg-split")
+
+    with ResultsStore(path, writable=True) as store:
+        store.write_row("ralph", [3, 4, UNSOLVED, 2])
+        store.write_row("slate", [3, 3, 4, 6])
+
+    with ResultsStore(path) as store:
+        assert store.mode == "avg-split"
+        assert store.played() == ["ralph", "slate"]
+        assert list(store.turns("slate")) == [3, 3, 4, 6]
+        assert list(store.column("sissy")) == [0, UNSOLVED, 4]
+        assert store.failures("ralph") == ["sissy"]
+        assert store.distribution("ralph") == {"2": 1, "3": 1, "4": 1, "X": 1}
+
+        summary = store.summary("ralph")
+        assert summary["win_percentage"] == 0.75
+        assert summary["average_turns"] == (3 + 4 + 6 + 2) / 4
+        assert summary["max_turns"] == 6
+
+        hardest = store.hardest_answers(n=2)
+        assert [r["answer"] for r in hardest] == ["sissy", "humph"]
@@ -1,3 +1,8 @@
+import time
+
+from wordle.game import WordleStepInfo
+
+
 def test_word_recommendations():
     pass
 
@@ -36,3 +41,265 @@ def test_solver_prob_mode():
 
 def test_solver_split_mode():
     pass
+
+
+def test_solver_time_budget():
+    from wordle.solver import WordleSolver
+
+    solver = WordleSolver()
+    solver.words = ("cigar", "rebut", "sissy", "humph", "awake", "blush")
+    recommendations = solver.recommend(time_budget_ms=0)
+    assert recommendations.tier == "probability"
+    assert recommendations.recommended in solver.words
+
+    recommendations = solver.recommend(time_budget_ms=60_000)
+    assert recommendations.tier == "exhaustive"
+    assert recommendations.recommended in solver.words
+
+
+def test_solver_time_budget_is_enforced(monkeypatch):
+    import wordle.solver
+    from wordle.data import load_words
+    from wordle.solver import (
+        _best_avg_words_in_bucket,
+        _eval_pattern,
+        _rank_before_deadline,
+        _rank_by_exhaustive_search,
+    )
+
+    # Without a cost model, tiers are only skipped based on measured times
+    monkeypatch.setattr(wordle.solver, "load_cost_model", lambda: None)
+    pattern = _eval_pattern("slate", "lawns")
+    words = tuple(w for w in load_words() if _eval_pattern("slate", w) == pattern)
+    assert 1 < len(words) <= 32
+
+    # Cold caches, where one exhaustive score takes far longer than the budget
+    _rank_by_exhaustive_search.cache_clear()
+    _best_avg_words_in_bucket.cache_clear()
+    budget = 0.01
+    start = time.perf_counter()
+    ranking, _ = _rank_before_deadline(words, start + budget)
+    assert time.perf_counter() - start < 5 * budget
+    assert set(ranking.top(len(words))) == set(words)
+
+
+def test_solver_lookahead_mode():
+    from wordle.solver import WordleSolver, _rank_by_lookahead
+
+    words = ("cigar", "rebut", "sissy", "humph", "awake", "blush", "focal", "evade")
+    ranked = _rank_by_lookahead(words, top_k=4)
+    assert sorted(ranked) == sorted(words)
+
+    solver = WordleSolver(mode="lookahead")
+    solver.words = words
+    assert solver.recommend().recommended == ranked[0]
+
+
+def test_word_ranking():
+    from wordle.solver import WordRanking
+
+    ranking = WordRanking({"a": 3.0, "b": 1.0, "c": 2.0, "d": 1.0})
+    assert len(ranking) == 4
+    assert ranking[0] == "b"
+    assert ranking.top(2) == ("b", "d")
+    assert ranking[1:3] == ("d", "c")
+    assert ranking[-1] == "a"
+    assert tuple(ranking) == ("b", "d", "c", "a")
+    assert "c" in ranking
+
+
+def test_fallback_pool():
+    from wordle.data import load_fallback_words
+    from wordle.game import _evaluate_guess
+    from wordle.solver import FallbackPool, WordleSolver, _filter_words_from_step_info
+
+    assert WordleSolver().fallback_words is WordleSolver().fallback_words
+
+    pool = FallbackPool()
+    _, letters = _evaluate_guess("slate", "cigar")
+    info = WordleStepInfo(step=1, letters=letters)
+    pool.update(info)
+    assert pool.words == _filter_words_from_step_info(load_fallback_words(), info)
+
+
+def test_multi_solver_joint_modes():
+    from wordle.solver import MultiWordleSolver, _joint_avg_words_after_guess
+
+    boards = (("cigar", "rebut", "sissy"), ("humph",))
+    # Guessing the answer of a board solves it
+    assert _joint_avg_words_after_guess("humph", boards[1:]) == 0.0
+    assert _joint_avg_words_after_guess("cigar", boards[:1]) == 2 / 3
+
+    for mode in ("joint-split", "joint-entropy"):
+        solver = MultiWordleSolver(num_words=3, mode=mode)
+        solver._step = 2
+        solver.solvers[0].words = boards[0]
+        solver.solvers[1].words = boards[1]
+        solver.dones[2] = True
+        recommendations = solver.recommend()
+        assert recommendations.recommended == "humph"
+        assert set(recommendations.alternatives) == set(boards[0])
+
+
+def test_many_wordle_solver():
+    from wordle.game import Sedecordle
+    from wordle.solver import ManyWordleSolver
+
+    game = Sedecordle(seed=0, silent=True)
+    solver = ManyWordleSolver(num_words=game.num_words, mode="probability")
+    guess = solver.recommend().recommended
+    while not game.done:
+        guess = solver.update(game.step(guess))
+
+    assert game._success
+    assert all(solver.dones)
+
+
+def test_multi_solver_endgame():
+    from wordle.solver import MultiWordleSolver, _rank_by_endgame_search
+
+    boards = (("cigar", "rebut"), ("humph", "awake", "blush"))
+    ranking = _rank_by_endgame_search(boards)
+    assert ranking.scores[ranking[0]] == 2.5
+
+    solver = MultiWordleSolver(num_words=2, mode="joint-split")
+    solver._step = 2
+    solver.solvers[0].words = boards[0]
+    solver.solvers[1].words = boards[1]
+    recommendations = solver.recommend()
+    assert recommendations.tier == "endgame"
+    assert recommendations.recommended == ranking[0]
+
+
+def test_solve_states():
+    from wordle.data import load_words
+    from wordle.solver import _read_records, solve_states
+
+    records = [
+        {"id": 0, "guesses": [], "feedback": []},
+        {"id": 1, "guesses": ["slate"], "feedback": ["bbbyy"]},
+        {"id": 2, "guesses": ["slate"], "feedback": ["⬛⬛⬛🟨🟨"]},
+        {"id": 3, "guesses": ["slate"], "feedback": ["bad"]},
+        {"id": 4, "guesses": ["slated"], "feedback": ["bbbyyb"]},
+        {"id": 5, "guesses": ["slate", "crane"], "feedback": ["bbbyy"]},
+    ]
+    results = list(solve_states(records, num_workers=2))
+    assert [r["id"] for r in results] == [0, 1, 2, 3, 4, 5]
+    assert results[0]["recommended"] == "slate"
+    assert results[0]["num_candidates"] == len(load_words())
+    # Both feedback spellings describe the same state
+    assert {k: v for k, v in results[1].items() if k != "id"} == {
+        k: v for k, v in results[2].items() if k != "id"
+    }
+    assert all("error" in r for r in results[3:])
+
+    unordered = list(solve_states(records, ordered=False, num_workers=2))
+    assert sorted(r["id"] for r in unordered) == [0, 1, 2, 3, 4, 5]
+
+    # Errors raised by a worker are reported for that record only
+    records = [{"id": 0, "guesses": ["abcdefghij"], "feedback": ["b" * 10]}]
+    results = list(solve_states(records, num_workers=1, word_length=10))
+    assert "error" in results[0]
+
+    # Lines that aren't JSON objects are reported, rather than ending the run
+    lines = ['{"id": 0, "guesses": [], "feedback": []}', "not json", "[1, 2]", "7"]
+    results = list(solve_states(_read_records(lines), num_workers=1))
+    assert [r["id"] for r in results] == [0, None, None, None]
+    assert "error" not in results[0]
+    assert all("error" in r for r in results[1:])
+
+
+def test_solver_turn_counts():
+    from wordle.data import load_words
+    from wordle.game import Wordle
+    from wordle.solver import WordleSolver, solver_turn_counts, worst_case_turns
+
+    counts = solver_turn_counts(first_guess="slate")
+    assert sum(counts.values()) == len(load_words())
+    assert counts[1] == 1
+    assert worst_case_turns(first_guess="slate") == max(counts)
+
+    # Agrees with simulating a game for the hardest answers
+    game = Wordle(silent=True, total_steps=100)
+    game._word = "rebut"
+    solver = WordleSolver()
+    guess = "slate"
+    while guess != game._word:
+        guess = solver.update(game.step(guess))
+    assert game._step <= max(counts)
+
+
+def test_variable_word_length(tmp_path, monkeypatch):
+    import wordle.data
+    from wordle.game import Wordle
+    from wordle.solver import (
+        WordleSolver,
+        _all_green_pattern,
+        _eval_pattern,
+        _pattern_row,
+    )
+
+    # Patterns are packed into the smallest type that fits
+    assert isinstance(_pattern_row("sera", ("sear", "ears")), bytes)
+    assert _pattern_row("banana", ("bandit",)).typecode == "H"
+    assert _pattern_row("abcdefghijk", ("kjihgfedcba",)).typecode == "I"
+    assert _eval_pattern("banana", "banana") == _all_green_pattern(6)
+    assert _eval_pattern("abcdefghijk", "abcdefghijk") == 3**11 - 1
+
+    words = ["banana", "bandit", "cabana", "sultan", "tandem", "anchor", "magnet"]
+    path = tmp_path / "words-6.txt"
+    path.write_text("\n".join(words))
+    default_path = wordle.data._words_path
+    monkeypatch.setattr(
+        wordle.data, "_words_path", lambda n: str(path) if n == 6 else default_path(n)
+    )
+
+    game = Wordle(seed=0, silent=True, word_length=6)
+    solver = WordleSolver(word_length=6)
+    guess = solver.recommend().recommended
+    while not game.done and guess != game._word:
+        guess = solver.update(game.step(guess))
+    assert guess == game._word
+
+
+def test_solver_snapshot_and_fork():
+    import pickle
+
+    from wordle.game import Wordle
+    from wordle.solver import SolverState, WordleSolver
+
+    game = Wordle(seed=0, silent=True)
+    game._word = "cigar"
+    solver = WordleSolver()
+    solver.filter(game.step(solver.recommend().recommended))
+
+    snapshot = solver.snapshot()
+    data = snapshot.to_bytes()
+    assert len(data) < 1024
+    assert SolverState.from_bytes(data) == snapshot
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+
+    restored = WordleSolver.from_state(snapshot)
+    assert restored.words == solver.words
+    assert restored.history == solver.history
+    assert restored.fallback_words == solver.fallback_words
+    assert restored.recommend() == solver.recommend()
+
+    fork = solver.fork()
+    fork.filter(game.step(fork.recommend().recommended))
+    assert len(fork.history) == 2 and len(solver.history) == 1
+    assert solver.snapshot() == snapshot
+
+
+def test_collapse_guesses():
+    from wordle.data import load_all_words
+    from wordle.solver import _collapse_guesses, _pattern_row
+
+    words = ("bills", "fills", "hills", "kills", "mills")
+    guesses = load_all_words()
+    classes = _collapse_guesses(guesses, words)
+    assert len(classes) < len(guesses) // 4
+    assert sorted(g for members in classes.values() for g in members) == sorted(guesses)
+    for representative, members in list(classes.items())[::50]:
+        row = _pattern_row(representative, words)
+        assert all(_pattern_row(g, words) == row for g in members)
@@ -0,0 +1,79 @@
+import os
+
+import wordle.solver
+from wordle.game import Wordle
+from wordle.solver import WordleSolver, _eval_pattern
+from wordle.tree import (
+    DecisionTree,
+    load_decision_tree,
+    load_opening_book,
+    save_decision_tree,
+    save_opening_book,
+)
+
+
+def test_decision_tree_round_trip(tmp_path):
+    tree = DecisionTree(
+        guess="cigar",
+        children={_eval_pattern("cigar", "rebut"): DecisionTree(guess="rebut")},
+        alternatives=("humph",),
+    )
+    path = os.path.join(tmp_path, "tree.json")
+    save_decision_tree(tree, path, metadata={"first_guess": "cigar"})
+    loaded = load_decision_tree(path)
+    assert loaded == tree
+    assert loaded.num_nodes() == 2
+
+
+def test_solver_follows_decision_tree():
+    tree = DecisionTree(
+        guess="cigar",
+        children={_eval_pattern("cigar", "rebut"): DecisionTree(guess="rebut")},
+    )
+    game = Wordle(silent=True)
+    game._word = "rebut"
+    solver = WordleSolver(decision_tree=tree)
+    recommendations = solver.recommend()
+    assert recommendations.recommended == "cigar"
+    assert recommendations.tier == "tree"
+    # Nodes without stored alternatives take them from the ranking
+    assert len(recommendations.alternatives) > 0
+    assert "cigar" not in recommendations.alternatives
+
+    assert solver.update(game.step("cigar")) == "rebut"
+    recommendations = solver.recommend(max_alternatives=2)
+    assert recommendations.recommended == "rebut"
+    assert 0 < len(recommendations.alternatives) <= 2
+    # Guesses off the tree fall back to the solver mode
+    solver.update(game.step("humph"))
+    assert solver.tree_node is None
+
+
+def test_solver_follows_opening_book(tmp_path, monkeypatch):
+    book = DecisionTree(
+        guess="slate",
+        children={
+            _eval_pattern("slate", "rebut"): DecisionTree(
+                guess="rebut", alternatives=("brute", "tuber")
+            )
+        },
+        alternatives=("blast", "tapir", "ralph"),
+    )
+    path = os.path.join(tmp_path, "opening-book.json")
+    save_opening_book({("turns-to-win", "slate"): book}, path=path)
+    books = load_opening_book(path)
+    assert books == {("turns-to-win", "slate"): book}
+    monkeypatch.setattr(wordle.solver, "load_opening_book", lambda: books)
+
+    game = Wordle(silent=True)
+    game._word = "rebut"
+    solver = WordleSolver()
+    assert solver.recommend().tier == "opening"
+    assert solver.update(game.step("slate")) == "rebut"
+    recommendations = solver.recommend()
+    assert recommendations.tier == "book"
+    assert recommendations.alternatives == ["brute", "tuber"]
+    # Other modes and openers have no book, so they rank live
+    solver = WordleSolver(mode="probability")
+    solver.update(game.step("slate"))
+    assert solver.tree_node is None
@@ -0,0 +1,265 @@
+import argparse
+import json
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from math import log2
+from typing import IO, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from wordle.data import load_words
+from wordle.solver import (
+    State,
+    WordleSolver,
+    _all_green_pattern,
+    _filter_words_from_step_info,
+    _pattern_row,
+    _step_info_from_pattern,
+    _steps_from_record,
+)
+
+CHUNK_SIZE = 256
+
+
+@lru_cache(maxsize=65536)
+def _state_words(state: State, word_length: int) -> Tuple[str, ...]:
+    """Candidate words after a sequence of steps.
+
+    Cached by state, so the first couple of steps, which most games share, are
+    only filtered once per worker.
+    """
+    if not state:
+        return load_words(word_length)
+    guess, pattern = state[-1]
+    info = _step_info_from_pattern(guess, pattern, step=len(state))
+    return _filter_words_from_step_info(_state_words(state[:-1], word_length), info)
+
+
+@lru_cache(maxsize=65536)
+def _expected_bits(guess: str, words: Tuple[str, ...]) -> float:
+    """Expected information (in bits) revealed by the evaluation of a guess."""
+    total = len(words)
+    counts = Counter(_pattern_row(guess, words)).values()
+    return -sum(c / total * log2(c / total) for c in counts)
+
+
+@lru_cache(maxsize=65536)
+def _recommend(state: State, mode: str, word_length: int) -> Optional[str]:
+    words = _state_words(state, word_length)
+    if not words:
+        return None
+    solver = WordleSolver(mode=mode, word_length=word_length)
+    solver.words = words
+    return solver.recommend().recommended
+
+
+def _analyze_step(state: State, guess: str, pattern: int, mode: str) -> Dict:
+    """Statistics for one guess, played from a given state.
+
+    'skill' is the information expected from the guess, relative to the solver's
+    recommendation.  It can exceed 1, since the solver doesn't only optimize for
+    information.  'luck' is the information actually gained, minus the amount
+    expected from the guess.
+    """
+    word_length = len(guess)
+    words = _state_words(state, word_length)
+    after = _state_words(state + ((guess, pattern),), word_length)
+    recommended = _recommend(state, mode, word_length)
+    expected = _expected_bits(guess, words)
+    best = _expected_bits(recommended, words) if recommended else 0.0
+    if best > 0:
+        skill = expected / best
+    else:
+        # Only one candidate is left, so the best guess is that candidate
+        skill = float(guess in words)
+
+    bits = log2(len(words) / len(after)) if after else 0.0
+    return {
+        "guess": guess,
+        "candidates_before": len(words),
+        "candidates_after": len(after),
+        "bits": bits,
+        "expected_bits": expected,
+        "skill": skill,
+        "luck": bits - expected,
+        "recommended": recommended,
+    }
+
+
+def analyze_game(record: Dict, mode: str = "turns-to-win") -> Dict:
+    """Per-guess statistics for one game record.
+
+    Games whose feedback contradicts every word in the word list are marked
+    'consistent: false', and analysis stops at the contradicting step.
+    """
+    state: State = ()
+    steps = []
+    for guess, pattern in _steps_from_record(record):
+        step = _analyze_step(state, guess, pattern, mode)
+        steps.append(step)
+        state += ((guess, pattern),)
+        solved = pattern == _all_green_pattern(len(guess))
+        if solved or step["candidates_after"] == 0:
+            break
+
+    success = bool(state) and state[-1][1] == _all_green_pattern(len(state[-1][0]))
+    consistent = all(s["candidates_after"] > 0 for s in steps)
+    return {
+        "id": record.get("id"),
+        "success": success,
+        "consistent": consistent,
+        "num_guesses": len(steps),
+        "skill": sum(s["skill"] for s in steps) / max(len(steps), 1),
+        "luck": sum(s["luck"] for s in steps),
+        "steps": steps,
+    }
+
+
+def _analyze_record(record: Dict, mode: str) -> Dict:
+    """Like 'analyze_game', but malformed records give an 'error' entry.
+
+    Records that already have an 'error' (lines that couldn't be parsed, see
+    'read_games') are passed through.
+    """
+    if isinstance(record, dict) and "error" in record:
+        return record
+    try:
+        return analyze_game(record, mode=mode)
+    except Exception as e:
+        record_id = record.get("id") if isinstance(record, dict) else None
+        return {"id": record_id, "error": f"Failed to analyze game: {e!r}"}
+
+
+def _analyze_chunk(records: List[Dict], mode: str) -> List[Dict]:
+    return [_analyze_record(record, mode=mode) for record in records]
+
+
+def _chunks(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    records = iter(records)
+    chunk = list(islice(records, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(records, size))
+
+
+def read_games(f: IO[str]) -> Iterator[Dict]:
+    """Game records, one per line.  Lines that aren't valid JSON give an 'error'
+    record, so that they're counted rather than ending the run.
+    """
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield {"id": None, "error": f"Invalid JSON: {e}"}
+
+
+def analyze_games(
+    records: Iterable[Dict],
+    mode: str = "turns-to-win",
+    num_workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Dict]:
+    """Analyze a stream of game records, in order, across worker processes.
+
+    Only a few chunks are in flight at a time, so memory use doesn't grow with
+    the number of records.  Each worker keeps its own cache of game states.
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    max_pending = 2 * num_workers
+    chunks = _chunks(records, chunk_size)
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_analyze_chunk, chunk, mode))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+@dataclass
+class GameStats:
+    """Aggregate statistics, updated one analyzed game at a time."""
+
+    num_games: int = 0
+    num_wins: int = 0
+    num_inconsistent: int = 0
+    num_errors: int = 0
+    num_guesses: int = 0
+    num_agreements: int = 0
+    total_skill: float = 0.0
+    total_luck: float = 0.0
+    guess_counts: Counter = field(default_factory=Counter)
+
+    def update(self, game: Dict):
+        self.num_games += 1
+        if "error" in game:
+            self.num_errors += 1
+            return
+        if not game["consistent"]:
+            self.num_inconsistent += 1
+            return
+
+        self.num_wins += game["success"]
+        self.guess_counts[game["num_guesses"] if game["success"] else "X"] += 1
+        for step in game["steps"]:
+            self.num_guesses += 1
+            self.num_agreements += step["guess"] == step["recommended"]
+            self.total_skill += step["skill"]
+            self.total_luck += step["luck"]
+
+    def summary(self) -> Dict:
+        num_invalid = self.num_inconsistent + self.num_errors
+        num_consistent = max(self.num_games - num_invalid, 1)
+        num_guesses = max(self.num_guesses, 1)
+        return {
+            "num_games": self.num_games,
+            "num_inconsistent": self.num_inconsistent,
+            "num_errors": self.num_errors,
+            "win_percentage": 100 * self.num_wins / num_consistent,
+            "guesses_per_game": self.num_guesses / num_consistent,
+            "solver_agreement": self.num_agreements / num_guesses,
+            "skill": self.total_skill / num_guesses,
+            "luck": self.total_luck / num_guesses,
+            "guess_distribution": {str(k): v for k, v in self.guess_counts.items()},
+        }
+
+
+def main_analyze_games():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", type=str, help="JSONL game records ('-' for stdin)")
+    parser.add_argument("--mode", type=str, default="turns-to-win")
+    parser.add_argument(
+        "--output", type=str, default=None, help="JSONL file for per-game results"
+    )
+    parser.add_argument("--num-workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    stats = GameStats()
+    f_in = sys.stdin if args.input == "-" else open(args.input, "r")
+    f_out = open(args.output, "w") if args.output else None
+    try:
+        games = analyze_games(
+            read_games(f_in),
+            mode=args.mode,
+            num_workers=args.num_workers,
+            chunk_size=args.chunk_size,
+        )
+        for game in games:
+            stats.update(game)
+            if f_out is not None:
+                f_out.write(json.dumps(game) + "\n")
+    finally:
+        if f_in is not sys.stdin:
+            f_in.close()
+        if f_out is not None:
+            f_out.close()
+
+    print(json.dumps(stats.summary(), indent=2))
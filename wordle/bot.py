@@ -1,22 +1,73 @@
 import argparse
 import datetime as dt
 import json
+import os
+import sys
+import urllib.error
 import urllib.request
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from wordle.game import Wordle, WordleStepInfo
 from wordle.solver import WordleSolver
 
-NYT_ENDPOINT = "https://www.nytimes.com/svc/wordle/v2/{date}.json"
+NYT_BASE_URL = "https://www.nytimes.com/svc/wordle/v2"
 TOTAL_STEPS = 6
+# Fetched payloads never change, so backfills only download each date once
+CACHE_DIR = os.path.join(os.path.dirname(__file__), os.path.pardir, "data", "nyt-cache")
+MAX_CONNECTIONS = 8
 
 
-def _fetch_wordle_payload(date: dt.date) -> dict:
-    url = NYT_ENDPOINT.format(date=date.strftime("%Y-%m-%d"))
-    with urllib.request.urlopen(url) as resp:  # nosec - known public endpoint
+def _fetch_wordle_payload(date: dt.date, base_url: str = NYT_BASE_URL) -> dict:
+    url = f"{base_url.rstrip('/')}/{date.isoformat()}.json"
+    with urllib.request.urlopen(url, timeout=30) as resp:  # nosec - known endpoint
         return json.loads(resp.read().decode("utf-8"))
 
 
+def _load_wordle_payload(
+    date: dt.date, base_url: str = NYT_BASE_URL, cache_dir: Optional[str] = None
+) -> dict:
+    if cache_dir is None:
+        return _fetch_wordle_payload(date, base_url=base_url)
+
+    path = os.path.join(cache_dir, f"{date.isoformat()}.json")
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            return json.load(f)
+
+    payload = _fetch_wordle_payload(date, base_url=base_url)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write then rename, so an interrupted backfill never leaves a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, path)
+    return payload
+
+
+def _fetch_wordle_payloads(
+    dates: Sequence[dt.date],
+    base_url: str = NYT_BASE_URL,
+    cache_dir: Optional[str] = CACHE_DIR,
+    max_connections: int = MAX_CONNECTIONS,
+) -> Iterator[Tuple[dt.date, Optional[dict]]]:
+    """Payloads for each date, in order, with at most 'max_connections' in flight.
+
+    Dates that can't be fetched yield 'None', so one missing puzzle doesn't stop
+    a long backfill.
+    """
+
+    def load(date: dt.date) -> Optional[dict]:
+        try:
+            return _load_wordle_payload(date, base_url=base_url, cache_dir=cache_dir)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            print(f"Failed to fetch {date}: {e}", file=sys.stderr)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_connections) as pool:
+        yield from zip(dates, pool.map(load, dates))
+
+
 def _simulate_game(answer: str, mode: str) -> List[WordleStepInfo]:
     game = Wordle(silent=True, total_steps=TOTAL_STEPS)
     game._word = answer
@@ -59,6 +110,46 @@ def _format_share_text(payload: dict, history: List[WordleStepInfo]) -> str:
     return f"Wordle {puzzle_number} {attempts_str}/{TOTAL_STEPS}\n\n{rows}"
 
 
+def _play_wordle(args: Tuple[dt.date, dict, str]) -> Dict:
+    date, payload, mode = args
+    answer = payload["solution"].lower()
+    history = _simulate_game(answer, mode=mode)
+    success = history[-1].success if history else False
+    return {
+        "date": date.isoformat(),
+        "puzzle": payload.get("days_since_launch"),
+        "answer": answer,
+        "mode": mode,
+        "success": success,
+        "num_guesses": len(history),
+        "guesses": [info.guess for info in history],
+        "share": _format_share_text(payload, history),
+    }
+
+
+def backfill_wordle(
+    start: dt.date,
+    end: dt.date,
+    mode: str = "turns-to-win",
+    base_url: str = NYT_BASE_URL,
+    cache_dir: Optional[str] = CACHE_DIR,
+    max_connections: int = MAX_CONNECTIONS,
+    num_workers: Optional[int] = None,
+) -> Iterator[Dict]:
+    """Replay the solver on every daily puzzle from 'start' to 'end' (inclusive).
+
+    Payloads are fetched by a thread pool, and games are simulated by a process
+    pool.  Yields one record per date, in date order.
+    """
+    dates = [start + dt.timedelta(days=i) for i in range((end - start).days + 1)]
+    payloads = _fetch_wordle_payloads(
+        dates, base_url=base_url, cache_dir=cache_dir, max_connections=max_connections
+    )
+    games = ((date, payload, mode) for date, payload in payloads if payload)
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        yield from pool.map(_play_wordle, games, chunksize=8)
+
+
 def main_bot_wordle():
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -68,10 +159,42 @@ def main_bot_wordle():
         help="YYYY-MM-DD (defaults to today)",
     )
     parser.add_argument("--mode", type=str, default="turns-to-win")
+    parser.add_argument(
+        "--start",
+        type=str,
+        default=None,
+        help="Backfill every puzzle from this date (YYYY-MM-DD) through '--date'",
+    )
+    parser.add_argument("--base-url", type=str, default=NYT_BASE_URL)
+    parser.add_argument("--cache-dir", type=str, default=CACHE_DIR)
+    parser.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS)
+    parser.add_argument("--num-workers", type=int, default=None)
+    parser.add_argument(
+        "--output", type=str, default=None, help="JSONL file (defaults to stdout)"
+    )
     args = parser.parse_args()
 
     date = dt.date.fromisoformat(args.date) if args.date else dt.date.today()
-    payload = _fetch_wordle_payload(date)
+    if args.start is not None:
+        records = backfill_wordle(
+            dt.date.fromisoformat(args.start),
+            date,
+            mode=args.mode,
+            base_url=args.base_url,
+            cache_dir=args.cache_dir,
+            max_connections=args.max_connections,
+            num_workers=args.num_workers,
+        )
+        f = open(args.output, "w") if args.output else sys.stdout
+        try:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        finally:
+            if f is not sys.stdout:
+                f.close()
+        return
+
+    payload = _load_wordle_payload(date, base_url=args.base_url)
     answer = payload["solution"].lower()
     history = _simulate_game(answer, mode=args.mode)
     print(_format_share_text(payload, history))
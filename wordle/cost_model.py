@@ -0,0 +1,182 @@
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import exp, log
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from wordle.game import _evaluate_guess
+
+COST_MODEL_PATH = os.path.join(
+    os.path.dirname(__file__), os.path.pardir, "data", "cost-model.json"
+)
+CALIBRATION_SIZES = (2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+Ranker = Callable[[Tuple[str, ...]], Sequence[str]]
+# Number of top-ranked words needed by a recommendation with alternatives
+NUM_RECOMMENDED = 6
+
+
+@dataclass
+class CostModel:
+    """Predicted ranker latency, fitted as 'seconds = scale * num_words ** power'."""
+
+    coefficients: Dict[str, Tuple[float, float]]
+    host: Dict[str, str] = field(default_factory=dict)
+
+    def predict_ms(self, ranker: str, num_words: int) -> float:
+        scale, power = self.coefficients[ranker]
+        return 1000 * scale * num_words**power
+
+    def select(
+        self, rankers: Sequence[str], num_words: int, budget_ms: float
+    ) -> Optional[str]:
+        """Most accurate ranker expected to finish within the budget.
+
+        'rankers' must be ordered from least to most accurate.
+        """
+        selected = None
+        for name in rankers:
+            if name not in self.coefficients:
+                continue
+            if self.predict_ms(name, num_words) <= budget_ms:
+                selected = name
+
+        return selected
+
+
+def _fit_power_law(
+    sizes: Sequence[int], seconds: Sequence[float]
+) -> Tuple[float, float]:
+    """Least-squares fit of 'seconds = scale * size ** power' in log-log space."""
+    xs = [log(s) for s in sizes]
+    ys = [log(max(t, 1e-9)) for t in seconds]
+    if len(xs) == 1:
+        return seconds[0] / sizes[0], 1.0
+
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    var = sum((x - x_mean) ** 2 for x in xs)
+    cov = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    power = cov / var
+    return exp(y_mean - power * x_mean), power
+
+
+def _sample_candidates(
+    words: Tuple[str, ...], size: int, rng: random.Random
+) -> Tuple[str, ...]:
+    """Sample words that share an evaluation pattern for some random guess.
+
+    These look like the candidate sets a solver actually ranks, which matters
+    for rankers (like exhaustive search) whose cost depends on word structure.
+    """
+    for _ in range(16):
+        guess = rng.choice(words)
+        buckets: Dict[tuple, List[str]] = {}
+        for word in words:
+            buckets.setdefault(_evaluate_guess(guess, word)[1], []).append(word)
+        large = [b for b in buckets.values() if len(b) >= size]
+        if large:
+            return tuple(rng.sample(rng.choice(large), size))
+
+    return tuple(rng.sample(words, size))
+
+
+def _time_ranker(
+    ranker: Ranker,
+    words: Tuple[str, ...],
+    repeats: int,
+    clear_caches: Optional[Callable[[], None]] = None,
+    max_seconds: float = float("inf"),
+) -> float:
+    """Median time to rank the words, with caches cleared before every run.
+
+    A solver mostly ranks candidate sets it hasn't seen before, so cold times
+    are what the cost model should predict.  Repeats stop early once a run
+    takes longer than 'max_seconds'.
+    """
+    # Bypass the 'lru_cache' on rankers, so that repeats are actually measured.
+    ranker = getattr(ranker, "__wrapped__", ranker)
+    seconds: List[float] = []
+    for _ in range(repeats):
+        if clear_caches is not None:
+            clear_caches()
+        start = time.perf_counter()
+        ranker(words)[:NUM_RECOMMENDED]
+        seconds.append(time.perf_counter() - start)
+        if seconds[-1] > max_seconds:
+            break
+    return statistics.median(seconds)
+
+
+def calibrate(
+    rankers: Dict[str, Ranker],
+    words: Tuple[str, ...],
+    sizes: Sequence[int] = CALIBRATION_SIZES,
+    repeats: int = 3,
+    max_seconds: float = 1.0,
+    seed: int = 0,
+    verbose: bool = False,
+    clear_caches: Optional[Callable[[], None]] = None,
+) -> CostModel:
+    """Microbenchmark each ranker on this host, and fit a cost model.
+
+    Sizes are measured in increasing order, and a ranker stops at the first size
+    that takes longer than 'max_seconds'.  'clear_caches' is called before every
+    timed run, so that rankers are measured (and fitted) cold.
+    """
+    rng = random.Random(seed)
+    coefficients: Dict[str, Tuple[float, float]] = {}
+    for name, ranker in rankers.items():
+        measured_sizes: List[int] = []
+        measured_seconds: List[float] = []
+        for size in sizes:
+            if size > len(words):
+                break
+            candidates = _sample_candidates(words, size, rng)
+            seconds = _time_ranker(
+                ranker,
+                candidates,
+                repeats=repeats,
+                clear_caches=clear_caches,
+                max_seconds=max_seconds,
+            )
+            measured_sizes.append(size)
+            measured_seconds.append(seconds)
+            if verbose:
+                print(f"{name:>12s} {size:>6d} words: {1000 * seconds:.3f} ms")
+            if seconds > max_seconds:
+                break
+
+        coefficients[name] = _fit_power_law(measured_sizes, measured_seconds)
+
+    host = {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "num_words": str(len(words)),
+    }
+    return CostModel(coefficients=coefficients, host=host)
+
+
+def save_cost_model(model: CostModel, path: str = COST_MODEL_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"coefficients": model.coefficients, "host": model.host}, f, indent=2)
+    load_cost_model.cache_clear()
+
+
+@lru_cache()
+def load_cost_model(path: str = COST_MODEL_PATH) -> Optional[CostModel]:
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r") as f:
+        data = json.load(f)
+    coefficients = {k: (v[0], v[1]) for k, v in data["coefficients"].items()}
+    return CostModel(coefficients=coefficients, host=data.get("host", {}))
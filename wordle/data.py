@@ -1,6 +1,7 @@
 import os
+import warnings
 from functools import lru_cache
-from typing import Tuple
+from typing import Iterator, Optional, Tuple
 
 import gdown
 
@@ -16,28 +17,109 @@ ALL_WORDS_PATH = os.path.join(
 )
 
 
+WORD_LENGTH = 5
+# Supported word lengths, for variants of the game
+MIN_WORD_LENGTH, MAX_WORD_LENGTH = 4, 11
+
+
+def _words_path(word_length: int) -> str:
+    """Answer list for a word length.  Lengths other than 5 use 'words-{n}.txt'."""
+    if word_length == WORD_LENGTH:
+        return WORDS_PATH
+    return os.path.join(os.path.dirname(WORDS_PATH), f"words-{word_length}.txt")
+
+
+def _all_words_path(word_length: int) -> str:
+    if word_length == WORD_LENGTH:
+        return ALL_WORDS_PATH
+    return os.path.join(os.path.dirname(ALL_WORDS_PATH), f"all-words-{word_length}.txt")
+
+
 def _download_words():
     os.makedirs(os.path.dirname(WORDS_PATH), exist_ok=True)
     gdown.download(WORDS_URL, WORDS_PATH)
 
 
+def load_words(word_length: int = WORD_LENGTH) -> Tuple[str, ...]:
+    return _load_words(word_length)
+
+
 @lru_cache()
-def load_words() -> Tuple[str, ...]:
-    if not os.path.exists(WORDS_PATH):
+def _load_words(word_length: int) -> Tuple[str, ...]:
+    # Cached by a positional argument, so that every caller shares one tuple
+    path = _words_path(word_length)
+    if not os.path.exists(path):
+        if word_length != WORD_LENGTH:
+            raise FileNotFoundError(
+                f"No word list for {word_length}-letter words. Expected one word "
+                f"per line in '{path}'."
+            )
         _download_words()
 
-    with open(WORDS_PATH, "r") as f:
+    with open(path, "r") as f:
         return tuple(line.lower().strip() for line in f.readlines())
 
 
+def load_all_words(word_length: int = WORD_LENGTH) -> Tuple[str, ...]:
+    return _load_all_words(word_length)
+
+
 @lru_cache()
-def load_all_words() -> Tuple[str, ...]:
-    if not os.path.exists(ALL_WORDS_PATH):
-        return load_words()
+def _load_all_words(word_length: int) -> Tuple[str, ...]:
+    path = _all_words_path(word_length)
+    if not os.path.exists(path):
+        return load_words(word_length)
 
-    with open(ALL_WORDS_PATH, "r") as f:
+    with open(path, "r") as f:
         all_words = set(line.lower().strip() for line in f.readlines())
     # Merge both lists, keeping words.txt order first
-    primary = load_words()
-    extra = tuple(w for w in sorted(all_words) if w not in set(primary))
+    primary = load_words(word_length)
+    primary_set = set(primary)
+    extra = tuple(w for w in sorted(all_words) if w not in primary_set)
     return primary + extra
+
+
+def load_fallback_words(word_length: int = WORD_LENGTH) -> Tuple[str, ...]:
+    """All valid guesses that are not possible answers."""
+    return _load_fallback_words(word_length)
+
+
+@lru_cache()
+def _load_fallback_words(word_length: int) -> Tuple[str, ...]:
+    primary = set(load_words(word_length))
+    return tuple(w for w in load_all_words(word_length) if w not in primary)
+
+
+def iter_dictionary(
+    path: str, word_length: Optional[int] = WORD_LENGTH
+) -> Iterator[str]:
+    """Stream unique, valid words from a custom dictionary, one word per line.
+
+    Words are lower-cased, and must be ASCII letters only, with 'word_length'
+    letters (any supported length if None).  Blank lines and '#' comments are
+    ignored, and other invalid lines are skipped with a single warning.
+    """
+    seen = set()
+    num_invalid = 0
+    with open(path, "r") as f:
+        for line in f:
+            word = line.strip().lower()
+            if not word or word.startswith("#"):
+                continue
+            length_ok = (
+                MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH
+                if word_length is None
+                else len(word) == word_length
+            )
+            if not (length_ok and word.isascii() and word.isalpha()):
+                num_invalid += 1
+            elif word not in seen:
+                seen.add(word)
+                yield word
+
+    if num_invalid:
+        warnings.warn(f"Skipped {num_invalid} invalid words in '{path}'.")
+
+
+def load_dictionary(path: str, word_length: int = WORD_LENGTH) -> Tuple[str, ...]:
+    return tuple(iter_dictionary(path, word_length=word_length))
@@ -0,0 +1,225 @@
+import sys
+from array import array
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from wordle.data import WORD_LENGTH, load_fallback_words, load_words
+from wordle.game import WordleStepInfo
+from wordle.solver import (
+    SolverState,
+    WordleSolver,
+    WordRanking,
+    WordRecommendations,
+    _word_index,
+)
+from wordle.tree import DecisionTree, load_opening_book
+
+# Guesses per block, when computing the pattern matrix
+MATRIX_BLOCK_ROWS = 128
+# Array scoring packs every pattern into one byte (3 ** 5 = 243 codes)
+ARRAY_MAX_WORD_LENGTH = 5
+
+
+def gil_enabled() -> bool:
+    """Whether the GIL is enabled (always, before free-threaded CPython 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def _import_numpy() -> Any:
+    """numpy, or None if it isn't installed (see the 'engine' extra)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _pattern_block(guesses: Any, truths: Any) -> Any:
+    """Patterns of each guess against each truth, from arrays of letter codes.
+
+    Vectorized '_eval_pattern': greens first, then yellows left to right, each
+    using up one unmatched copy of the letter in the truth.
+    """
+    np = _import_numpy()
+    word_length = guesses.shape[1]
+    # Copies of each letter in each truth
+    letter_counts = np.zeros((len(truths), 256), dtype=np.int16)
+    for j in range(word_length):
+        np.add.at(letter_counts, (np.arange(len(truths)), truths[:, j]), 1)
+
+    greens = [guesses[:, i, None] == truths[None, :, i] for i in range(word_length)]
+    yellows: List[Any] = []
+    pattern = np.zeros((len(guesses), len(truths)), dtype=np.uint8)
+    for i in range(word_length):
+        letter = guesses[:, i]
+        available = np.ascontiguousarray(letter_counts[:, letter].T)
+        for j in range(word_length):
+            same = (guesses[:, j] == letter)[:, None]
+            available -= greens[j] & same
+            if j < i:
+                available -= yellows[j] & same
+        yellow = ~greens[i] & (available > 0)
+        yellows.append(yellow)
+        pattern *= 3
+        pattern += greens[i]
+        pattern += greens[i]
+        pattern += yellow
+    return pattern
+
+
+@lru_cache(maxsize=None)
+def pattern_matrix(word_length: int = WORD_LENGTH) -> Any:
+    """Patterns of every word against every word, as a read-only numpy array.
+
+    Entry '[i, j]' is '_eval_pattern(words[i], words[j])' for the words of
+    'load_words', one byte each.  Rows are computed in blocks, to bound memory.
+    """
+    np = _import_numpy()
+    if np is None:
+        raise ImportError("The pattern matrix requires numpy.")
+    if word_length > ARRAY_MAX_WORD_LENGTH:
+        raise ValueError(f"Word length {word_length} doesn't fit one-byte patterns.")
+
+    words = load_words(word_length)
+    letters = np.array([[ord(c) for c in w] for w in words], dtype=np.uint8)
+    matrix = np.empty((len(words), len(words)), dtype=np.uint8)
+    for i in range(0, len(words), MATRIX_BLOCK_ROWS):
+        block = letters[i : i + MATRIX_BLOCK_ROWS]
+        matrix[i : i + len(block)] = _pattern_block(block, letters)
+    # Shared by every thread, so make sure that nothing can modify it
+    matrix.setflags(write=False)
+    return matrix
+
+
+@lru_cache(maxsize=2048)
+def _rank_by_split_array(
+    candidates: bytes, word_length: int, mode: str
+) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    """Split scores for candidate indices (packed 'I'), from the pattern matrix.
+
+    Same scores as '_rank_by_average_split' or '_rank_by_maximum_split', but the
+    buckets are counted by numpy, which releases the GIL while it works.
+    """
+    np = _import_numpy()
+    matrix = pattern_matrix(word_length)
+    indices = np.frombuffer(candidates, dtype=np.uint32)
+    num_words, num_patterns = len(indices), 3**word_length
+
+    # One bincount over all rows, offsetting each row into its own range of bins
+    codes = matrix[np.ix_(indices, indices)].astype(np.intp)
+    codes += np.arange(num_words, dtype=np.intp)[:, None] * num_patterns
+    counts = np.bincount(codes.ravel(), minlength=num_words * num_patterns)
+    counts = counts.reshape(num_words, num_patterns)
+    if mode == "max-split":
+        scores = counts.max(axis=1).tolist()
+    else:
+        scores = ((counts * counts).sum(axis=1) / num_words).tolist()
+
+    words = load_words(word_length)
+    return tuple(words[i] for i in indices.tolist()), tuple(scores)
+
+
+def _array_mode(mode: str, num_words: int) -> Optional[str]:
+    """Split ranking that a solver mode uses for this many words, if any."""
+    if mode in ("avg-split", "max-split"):
+        return mode
+    elif mode == "turns-to-win" and num_words <= 128:
+        return "avg-split"
+    elif mode == "win-percentage" and 32 < num_words <= 128:
+        return "avg-split"
+    return None
+
+
+class _ArraySolver(WordleSolver):
+    """'WordleSolver' that scores splits on the shared pattern matrix."""
+
+    def _rank(
+        self, start: float, time_budget_ms: Optional[float]
+    ) -> Tuple[WordRanking, str]:
+        mode = None
+        if time_budget_ms is None and len(self.words) > 1:
+            mode = _array_mode(self.mode, len(self.words))
+        if mode is None:
+            return super()._rank(start, time_budget_ms)
+
+        index = _word_index(self.word_length)
+        candidates = array("I", (index[w] for w in self.words)).tobytes()
+        words, scores = _rank_by_split_array(candidates, self.word_length, mode)
+        return WordRanking(dict(zip(words, scores))), self.mode
+
+
+class SolverEngine:
+    """Solver that can be shared by any number of threads.
+
+    The engine only holds immutable settings and shared word lists, and every
+    game ('session') is an immutable 'SolverState'.  Each call works on a private
+    solver, rebuilt from the session in microseconds, so no mutable state is
+    shared between threads.  The module-level caches behind the rankers are
+    thread-safe, and cached rankings are never modified once built.
+
+    With 'array_scoring' (and numpy installed), split rankings are computed on a
+    shared, read-only pattern matrix (see 'pattern_matrix').  numpy releases the
+    GIL while it counts buckets, so threads can score in parallel.
+    """
+
+    def __init__(
+        self,
+        mode: str = "turns-to-win",
+        time_budget_ms: Optional[float] = None,
+        decision_tree: Optional[DecisionTree] = None,
+        use_opening_book: bool = True,
+        word_length: int = WORD_LENGTH,
+        array_scoring: bool = True,
+    ):
+        self.mode = mode
+        self.time_budget_ms = time_budget_ms
+        self.decision_tree = decision_tree
+        self.use_opening_book = use_opening_book
+        self.word_length = word_length
+        self.array_scoring = (
+            array_scoring
+            and word_length <= ARRAY_MAX_WORD_LENGTH
+            and _import_numpy() is not None
+        )
+
+        # Load shared data up front, rather than racing on the first requests
+        load_words(word_length)
+        load_fallback_words(word_length)
+        if use_opening_book:
+            load_opening_book()
+        if self.array_scoring:
+            pattern_matrix(word_length)
+        self._initial_state = self._solver().snapshot()
+
+    def _solver(self, state: Optional[SolverState] = None) -> WordleSolver:
+        solver_cls = _ArraySolver if self.array_scoring else WordleSolver
+        if state is None:
+            return solver_cls(
+                mode=self.mode,
+                time_budget_ms=self.time_budget_ms,
+                decision_tree=self.decision_tree,
+                use_opening_book=self.use_opening_book,
+                word_length=self.word_length,
+            )
+        return solver_cls.from_state(state, decision_tree=self.decision_tree)
+
+    def new_session(self) -> SolverState:
+        return self._initial_state
+
+    def update(self, state: SolverState, step_info: WordleStepInfo) -> SolverState:
+        """Session after one more step.  The given session is left unchanged."""
+        solver = self._solver(state)
+        solver.filter(step_info)
+        return solver.snapshot()
+
+    def recommend(
+        self,
+        state: SolverState,
+        max_alternatives: int = 5,
+        time_budget_ms: Optional[float] = None,
+    ) -> WordRecommendations:
+        solver = self._solver(state)
+        return solver.recommend(
+            max_alternatives=max_alternatives, time_budget_ms=time_budget_ms
+        )
@@ -1,20 +1,25 @@
-from collections import Counter
 import argparse
 import random
 import time
+from array import array
+from collections import Counter
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from colorama import Fore
 
-from wordle.data import load_words
+from wordle.data import MAX_WORD_LENGTH, MIN_WORD_LENGTH, WORD_LENGTH, load_words
 
-WORD_LENGTH = 5
 # STEPS_PER_GAME = 6
-MARKDOWN_LETTER_TEMPLATE = """
-<p style='color:{color};background-color:gray;font-size:24px;text-align:center'><b>{letter}</b></p>
-"""
+HTML_LETTER_TEMPLATE = (
+    "<p style='color:{color};background-color:gray;font-size:24px;"
+    "text-align:center;margin:0'><b>{letter}</b></p>"
+)
+HTML_BOARD_TEMPLATE = (
+    "<div style='display:grid;grid-template-columns:repeat({columns},1fr);gap:8px'>"
+    "{letters}</div>"
+)
 
 
 @dataclass
@@ -49,7 +54,11 @@ class WordleStepInfo:
         return "".join([letter.text for letter in self.letters])
 
 
-EMPTY_STEP_INFO = WordleStepInfo(step=0, letters=(EMPTY_LETTER,) * 5)
+def _empty_step_info(word_length: int = WORD_LENGTH) -> WordleStepInfo:
+    return WordleStepInfo(step=0, letters=(EMPTY_LETTER,) * word_length)
+
+
+EMPTY_STEP_INFO = _empty_step_info()
 
 
 @lru_cache(maxsize=65536)
@@ -65,7 +74,7 @@ def _evaluate_guess(
     #     remaining[c] = remaining.get(c, 0) + 1
 
     # First pass: identify exact (green) matches
-    is_green = [False] * WORD_LENGTH
+    is_green = [False] * len(truth)
     letters = []
     for i, (g, t) in enumerate(zip(guess, truth)):
         if g == t:
@@ -89,15 +98,25 @@ def _evaluate_guess(
 
 class Wordle:
     def __init__(
-        self, seed: Optional[int] = None, total_steps: int = 6, silent: bool = False
+        self,
+        seed: Optional[int] = None,
+        total_steps: int = 6,
+        silent: bool = False,
+        word_length: int = WORD_LENGTH,
     ):
-        word_bank = load_words()
+        if not MIN_WORD_LENGTH <= word_length <= MAX_WORD_LENGTH:
+            raise ValueError(
+                f"Word length must be between {MIN_WORD_LENGTH} and "
+                f"{MAX_WORD_LENGTH}, but got {word_length}."
+            )
+        word_bank = load_words(word_length)
         if seed is None:
             seed = int(time.time())
-        random.seed(seed)
-        self._word = random.choice(word_bank)
+        # A local generator, so concurrent games never reseed each other
+        self._word = random.Random(seed).choice(word_bank)
         self.total_steps = total_steps
         self.silent = silent
+        self.word_length = word_length
 
         self._step = 1
         self._success = False
@@ -174,10 +193,12 @@ class MultiWordle:
         all_done = all(wordle.done for wordle in self.wordles)
         return all_done or self._step >= self.total_steps
 
-    def step(self, guess: str) -> List[WordleStepInfo]:
-        out: List[WordleStepInfo] = []
+    def step(self, guess: str) -> List[Optional[WordleStepInfo]]:
+        """Step info for each board, or None for boards that were already solved."""
+        out: List[Optional[WordleStepInfo]] = []
         for i, wordle in enumerate(self.wordles, 1):
             if wordle.done:
+                out.append(None)
                 continue
 
             info = wordle.step(guess)
@@ -224,44 +245,205 @@ class Octordle(MultiWordle):
         super().__init__(num_words=8, total_steps=total_steps, seed=seed, silent=silent)
 
 
-class StreamlitWordle(Wordle):
-    def _render_step_info_streamlit(self, info: WordleStepInfo):
-        import streamlit as st
+class ManyWordle:
+    """Multi-board game that stores all boards as arrays, for large board counts.
 
-        columns = st.columns(5)
-        letters = info.letters
+    Secrets are stored as indices into the shared word bank, and each board has
+    a done flag.  Unlike 'MultiWordle', 'step' returns one entry per board,
+    which is None for boards that were already solved.
+    """
 
-        for column, letter in zip(columns, letters):
-            if letter.text == "_":
-                color = "Gray"
-            elif letter.in_correct_position:
-                color = "Green"
-            elif letter.in_word:
-                color = "Yellow"
-            else:
-                color = "Red"
-            with column:
-                st.markdown(
-                    MARKDOWN_LETTER_TEMPLATE.format(
-                        color=color, letter=letter.text.upper()
-                    ),
-                    unsafe_allow_html=True,
+    def __init__(
+        self,
+        num_words: int,
+        total_steps: int,
+        seed: Optional[int] = None,
+        silent: bool = False,
+    ):
+        self.word_bank = load_words()
+        if seed is None:
+            seed = int(time.time())
+        rng = random.Random(seed)
+        self.secrets = array(
+            "H", [rng.randrange(len(self.word_bank)) for _ in range(num_words)]
+        )
+        self.dones = bytearray(num_words)
+        self.num_words = num_words
+        self.total_steps = total_steps
+        self.silent = silent
+
+        self._step = 1
+        self._success = False
+        self.history: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        return self._success or self._step >= self.total_steps
+
+    def step(self, guess: str) -> List[Optional[WordleStepInfo]]:
+        out: List[Optional[WordleStepInfo]] = []
+        for i, (secret, done) in enumerate(zip(self.secrets, self.dones)):
+            if done:
+                out.append(None)
+                continue
+
+            success, letters = _evaluate_guess(guess, self.word_bank[secret])
+            self.dones[i] = success
+            out.append(
+                WordleStepInfo(
+                    step=self._step, success=success, done=success, letters=letters
                 )
+            )
 
-    def _render_empty_step_streamlit(self):
-        self._render_step_info_streamlit()
+        self.history.append(guess)
+        self._success = all(self.dones)
+        done = self.done
+        if not done:
+            self._step += 1
 
-    def render_streamlit(self):
-        for step in self.history:
-            self._render_step_info_streamlit(step)
+        if not self.silent:
+            self._print_step(out, done=done)
+
+        return out
+
+    def _print_step(self, step_info: List[Optional[WordleStepInfo]], done: bool):
+        for i, info in enumerate(step_info, 1):
+            if info is None:
+                continue
+            print(f"Word {i} of {self.num_words}: ", end="")
+            for letter in info.letters:
+                if letter.in_correct_position:
+                    color = Fore.GREEN
+                elif letter.in_word:
+                    color = Fore.YELLOW
+                else:
+                    color = Fore.RED
+                print(f"{color}{letter.text}{Fore.RESET}", end=" ")
+            print()
+
+        print(f"{sum(self.dones)} of {self.num_words} words solved\n")
+        if self._success:
+            print(f"{Fore.GREEN}YOU WIN!{Fore.RESET}")
+        elif done:
+            print(f"{Fore.RED}You lost :(")
+            missed = [
+                self.word_bank[s] for s, d in zip(self.secrets, self.dones) if not d
+            ]
+            print(
+                f"The words were: {Fore.GREEN}{', '.join(missed).upper()}{Fore.RESET}"
+            )
+
+    def play(self):
+        print(f"{self.__class__.__name__}!\n")
+        print(f"Num words: {self.num_words}\n")
+
+        while not self.done:
+            print(f"Step {self._step} of {self.total_steps}")
+            guess = input("Enter a guess: ").lower().strip()
+            _ = self.step(guess)
 
+
+class Sedecordle(ManyWordle):
+    def __init__(
+        self, total_steps: int = 21, seed: Optional[int] = None, silent: bool = False
+    ):
+        super().__init__(
+            num_words=16, total_steps=total_steps, seed=seed, silent=silent
+        )
+
+
+class Duotrigordle(ManyWordle):
+    def __init__(
+        self, total_steps: int = 37, seed: Optional[int] = None, silent: bool = False
+    ):
+        super().__init__(
+            num_words=32, total_steps=total_steps, seed=seed, silent=silent
+        )
+
+
+class Sexaginquattuordle(ManyWordle):
+    def __init__(
+        self, total_steps: int = 69, seed: Optional[int] = None, silent: bool = False
+    ):
+        super().__init__(
+            num_words=64, total_steps=total_steps, seed=seed, silent=silent
+        )
+
+
+class Absurdle(Wordle):
+    """Adversarial Wordle, where the answer is never chosen up front.
+
+    After each guess, the host keeps whichever evaluation pattern leaves the
+    most candidate words (preferring fewer green and yellow letters on ties),
+    so the player only wins once a single candidate is left and guessed.
+    """
+
+    def __init__(
+        self,
+        total_steps: int = 100,
+        silent: bool = False,
+        word_length: int = WORD_LENGTH,
+    ):
+        super().__init__(
+            total_steps=total_steps, silent=silent, word_length=word_length
+        )
+        self.words = load_words(word_length)
+
+    def step(self, guess: str) -> WordleStepInfo:
+        # Imported here, since the solver depends on this module
+        from wordle.solver import _pattern_row
+
+        row = _pattern_row(guess, self.words)
+        counts = Counter(row)
+        pattern = max(counts, key=lambda p: (counts[p], -p))
+        self.words = tuple(w for w, p in zip(self.words, row) if p == pattern)
+        self._word = self.words[0]
+        return super().step(guess)
+
+    def play(self):
+        print("Absurdle!\n")
+
+        while not self.done:
+            print(f"Step {self._step} ({len(self.words)} words remaining)")
+            guess = input("Enter a guess: ").lower().strip()
+            _ = self.step(guess)
+
+
+class StreamlitWordle(Wordle):
+    @staticmethod
+    def _letter_html(letter: LetterEvaluation) -> str:
+        if letter.empty:
+            color = "Gray"
+        elif letter.in_correct_position:
+            color = "Green"
+        elif letter.in_word:
+            color = "Yellow"
+        else:
+            color = "Red"
+        return HTML_LETTER_TEMPLATE.format(color=color, letter=letter.text.upper())
+
+    def to_html(self) -> str:
+        """The whole board as one HTML block, including the empty rows."""
         remaining_steps = self.total_steps - len(self.history)
-        for _ in range(remaining_steps):
-            self._render_step_info_streamlit(info=EMPTY_STEP_INFO)
+        steps = self.history + [_empty_step_info(self.word_length)] * remaining_steps
+        letters = "".join(
+            self._letter_html(letter) for info in steps for letter in info.letters
+        )
+        return HTML_BOARD_TEMPLATE.format(columns=self.word_length, letters=letters)
+
+    def render_streamlit(self):
+        import streamlit as st
+
+        # A single element per board, rather than one per letter, keeps reruns cheap
+        st.markdown(self.to_html(), unsafe_allow_html=True)
 
 
 def main_wordle():
-    Wordle().play()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--word-length", type=int, default=WORD_LENGTH)
+    args = parser.parse_args()
+
+    Wordle(word_length=args.word_length).play()
 
 
 def main_multi_wordle():
@@ -273,6 +455,14 @@ def main_multi_wordle():
     MultiWordle(num_words=args.num_words, total_steps=args.total_steps).play()
 
 
+def main_absurdle():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--word-length", type=int, default=WORD_LENGTH)
+    args = parser.parse_args()
+
+    Absurdle(word_length=args.word_length).play()
+
+
 def main_quordle():
     Quordle().play()
 
@@ -283,3 +473,15 @@ def main_dordle():
 
 def main_octordle():
     Octordle().play()
+
+
+def main_sedecordle():
+    Sedecordle().play()
+
+
+def main_duotrigordle():
+    Duotrigordle().play()
+
+
+def main_sexaginquattuordle():
+    Sexaginquattuordle().play()
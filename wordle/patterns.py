@@ -0,0 +1,325 @@
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+from math import isqrt, log2
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from wordle.data import load_dictionary
+from wordle.game import WordleStepInfo
+from wordle.solver import (
+    WordRanking,
+    WordRecommendations,
+    _collapse_guesses,
+    _eval_pattern,
+    _pattern_from_step_info,
+    _pattern_typecode,
+    _rank_by_chain_prob,
+)
+
+# Guesses per tile, when building or scanning a pattern table
+TILE_ROWS = 256
+# Pattern lookups allowed per recommendation, before the guess pool is trimmed
+MAX_SCORING_WORK = 2**24
+# Guesses are only collapsed into equivalence classes for this few candidates.
+# With more, nearly every guess has a distinct pattern row anyway.
+COLLAPSE_MAX_CANDIDATES = 64
+
+
+def _metadata_path(path: str) -> str:
+    return f"{path}.json"
+
+
+_answers: Tuple[str, ...] = ()
+
+
+def _init_worker(answers: Tuple[str, ...]):
+    global _answers
+    _answers = answers
+
+
+def _compute_tile(path: str, start: int, guesses: Tuple[str, ...], typecode: str):
+    """Write the pattern rows for a tile of guesses, starting at row 'start'."""
+    eval_pattern = _eval_pattern.__wrapped__
+    tile = array(typecode)
+    for guess in guesses:
+        tile.extend(eval_pattern(guess, answer) for answer in _answers)
+
+    offset = start * len(_answers) * tile.itemsize
+    data = tile.tobytes()
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        mm[offset : offset + len(data)] = data
+    return len(guesses)
+
+
+def build_pattern_table(
+    guesses: Tuple[str, ...],
+    answers: Tuple[str, ...],
+    path: str,
+    tile_rows: int = TILE_ROWS,
+    num_workers: Optional[int] = None,
+    verbose: bool = False,
+):
+    """Compute the guess-by-answer pattern table into a memory-mapped file.
+
+    Tiles of 'tile_rows' guesses are computed by a process pool, and each worker
+    writes its tile straight into the file.  So no process ever holds more than
+    one tile, however large the dictionaries are.
+    """
+    word_length = len(answers[0])
+    typecode = _pattern_typecode(word_length)
+    itemsize = array(typecode).itemsize
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.truncate(len(guesses) * len(answers) * itemsize)
+
+    start_time = time.time()
+    with ProcessPoolExecutor(
+        max_workers=num_workers, initializer=_init_worker, initargs=(answers,)
+    ) as pool:
+        futures = [
+            pool.submit(_compute_tile, path, i, guesses[i : i + tile_rows], typecode)
+            for i in range(0, len(guesses), tile_rows)
+        ]
+        done = 0
+        for future in as_completed(futures):
+            done += future.result()
+            if verbose:
+                print(
+                    f"{done}/{len(guesses)} guesses, "
+                    f"{time.time() - start_time:.1f}s elapsed",
+                    file=sys.stderr,
+                )
+
+    metadata = {
+        "word_length": word_length,
+        "typecode": typecode,
+        "guesses": guesses,
+        "answers": answers,
+    }
+    with open(_metadata_path(path), "w") as f:
+        json.dump(metadata, f)
+
+
+class PatternTable:
+    """Read-only, memory-mapped view of a table from 'build_pattern_table'.
+
+    Rows are read straight from the mapped file, so only the pages that are
+    actually scanned are loaded, and the OS can drop them again under pressure.
+    """
+
+    def __init__(self, path: str):
+        with open(_metadata_path(path), "r") as f:
+            metadata = json.load(f)
+        self.word_length: int = metadata["word_length"]
+        self.typecode: str = metadata["typecode"]
+        self.guesses: Tuple[str, ...] = tuple(metadata["guesses"])
+        self.answers: Tuple[str, ...] = tuple(metadata["answers"])
+        self.guess_index: Dict[str, int] = {g: i for i, g in enumerate(self.guesses)}
+
+        self._itemsize = array(self.typecode).itemsize
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> "PatternTable":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+    def row(self, guess_index: int) -> Sequence[int]:
+        """Patterns of one guess against every answer.
+
+        Only this row is copied out of the mapped file, so rows can outlive the
+        table, and memory use is bounded by the rows being scanned.
+        """
+        row_bytes = len(self.answers) * self._itemsize
+        data = self._mmap[guess_index * row_bytes : (guess_index + 1) * row_bytes]
+        if self.typecode == "B":
+            return data
+        row = array(self.typecode)
+        row.frombytes(data)
+        return row
+
+    def tiles(
+        self, guess_indices: Sequence[int], tile_rows: int = TILE_ROWS
+    ) -> Iterator[List[Tuple[int, Sequence[int]]]]:
+        """Rows for the given guesses, in file order, one tile at a time."""
+        ordered = iter(sorted(guess_indices))
+        tile = list(islice(ordered, tile_rows))
+        while tile:
+            yield [(i, self.row(i)) for i in tile]
+            tile = list(islice(ordered, tile_rows))
+
+
+def _bucket_score(counts: Sequence[int], total: int, mode: str) -> float:
+    if mode == "entropy":
+        return sum(c / total * log2(c / total) for c in counts)
+    return sum(c * c for c in counts) / total
+
+
+def score_guesses(
+    table: PatternTable,
+    candidates: Sequence[int],
+    guess_indices: Sequence[int],
+    mode: str = "avg-split",
+    tile_rows: int = TILE_ROWS,
+) -> WordRanking:
+    """Rank guesses by how well they split the candidate answers.
+
+    Modes are 'avg-split' (expected number of remaining answers) or 'entropy'.
+    Once few candidates are left, guesses are first collapsed into classes with
+    identical patterns (see '_collapse_guesses'), and only one row per class is
+    read.  Rows that turn out identical anyway are also only scored once.  The
+    table is scanned tile by tile, and only one tile is resident at a time.
+    Candidate answers are preferred on ties, since they might solve the game.
+    """
+    if mode not in ("avg-split", "entropy"):
+        raise ValueError(f"Pattern table scoring mode '{mode}' is not supported.")
+
+    answers = table.answers
+    candidate_words = {answers[j] for j in candidates}
+    guesses = [table.guesses[i] for i in sorted(guess_indices)]
+    collapse = len(candidates) <= COLLAPSE_MAX_CANDIDATES
+    if collapse:
+        classes = _collapse_guesses(guesses, [answers[j] for j in candidates])
+        rows = [table.guess_index[g] for g in classes]
+    else:
+        rows = sorted(guess_indices)
+
+    get_patterns = itemgetter(*candidates) if len(candidates) > 1 else None
+    row_scores: Dict[Sequence[int], float] = {}
+    scores: Dict[str, float] = {}
+    for tile in table.tiles(rows, tile_rows=tile_rows):
+        for i, row in tile:
+            patterns = (0,) if get_patterns is None else get_patterns(row)
+            score = row_scores.get(patterns) if collapse else None
+            if score is None:
+                counts = list(Counter(patterns).values())
+                score = _bucket_score(counts, len(candidates), mode)
+                if collapse:
+                    row_scores[patterns] = score
+            scores[table.guesses[i]] = score
+
+    if collapse:
+        for representative, members in classes.items():
+            for guess in members:
+                scores[guess] = scores[representative]
+    # In table order, like an uncollapsed scan
+    return WordRanking({g: (scores[g], g not in candidate_words) for g in guesses})
+
+
+class PatternTableSolver:
+    """Solver for dictionaries too large to hold a pattern table in memory.
+
+    Candidate answers are tracked as an array of indices into the table, and
+    narrowed with one row of the table per guess.  Recommendations score at most
+    'max_work' pattern lookups: every guess while few candidates are left, then
+    only the candidates, and finally only the most probable candidates.
+    """
+
+    def __init__(
+        self,
+        table: PatternTable,
+        mode: str = "avg-split",
+        opening: Optional[str] = None,
+        max_work: int = MAX_SCORING_WORK,
+    ):
+        self.table = table
+        self.mode = mode
+        self.opening = opening
+        self.max_work = max_work
+        self.candidates = array("I", range(len(table.answers)))
+        self.ranking: Optional[WordRanking] = None
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        answers = self.table.answers
+        return tuple(answers[j] for j in self.candidates)
+
+    def _guess_pool(self) -> Sequence[int]:
+        table, num_candidates = self.table, len(self.candidates)
+        if num_candidates * len(table.guesses) <= self.max_work:
+            return range(len(table.guesses))
+
+        words = self.words
+        max_guesses = max(self.max_work // num_candidates, 1)
+        if num_candidates > max_guesses:
+            words = _rank_by_chain_prob(words).top(max_guesses)
+        return [table.guess_index[w] for w in words if w in table.guess_index]
+
+    def recommend(self, max_alternatives: int = 5) -> WordRecommendations:
+        if self.opening and len(self.candidates) == len(self.table.answers):
+            return WordRecommendations(recommended=self.opening, tier="opening")
+        if not self.candidates:
+            return WordRecommendations(recommended=None, tier=self.mode)
+
+        pool = self._guess_pool()
+        if not pool:
+            # No candidate is a valid guess, so fall back to the most probable ones
+            num_guesses = isqrt(self.max_work)
+            top = _rank_by_chain_prob(self.table.guesses).top(num_guesses)
+            pool = [self.table.guess_index[w] for w in top]
+
+        self.ranking = score_guesses(self.table, self.candidates, pool, mode=self.mode)
+        top = self.ranking.top(max_alternatives + 1)
+        return WordRecommendations(
+            recommended=top[0], alternatives=top[1:], tier=self.mode
+        )
+
+    def filter(self, step_info: WordleStepInfo):
+        guess = step_info.guess
+        pattern = _pattern_from_step_info(step_info)
+        index = self.table.guess_index.get(guess)
+        if index is not None:
+            row = self.table.row(index)
+            matches = (j for j in self.candidates if row[j] == pattern)
+        else:
+            answers = self.table.answers
+            matches = (
+                j
+                for j in self.candidates
+                if _eval_pattern(guess, answers[j]) == pattern
+            )
+        self.candidates = array("I", matches)
+
+    def update(self, step_info: WordleStepInfo) -> Optional[str]:
+        self.filter(step_info)
+        return self.recommend(max_alternatives=0).recommended
+
+
+def main_build_pattern_table():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--guesses", type=str, required=True)
+    parser.add_argument("--answers", type=str, required=True)
+    parser.add_argument("--output", type=str, required=True)
+    parser.add_argument("--word-length", type=int, default=5)
+    parser.add_argument("--tile-rows", type=int, default=TILE_ROWS)
+    parser.add_argument("--num-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    answers = load_dictionary(args.answers, word_length=args.word_length)
+    # Answers are always valid guesses, and keep their place at the front
+    extra = load_dictionary(args.guesses, word_length=args.word_length)
+    answer_set = set(answers)
+    guesses = answers + tuple(w for w in extra if w not in answer_set)
+    build_pattern_table(
+        guesses,
+        answers,
+        args.output,
+        tile_rows=args.tile_rows,
+        num_workers=args.num_workers,
+        verbose=True,
+    )
+    print(f"Saved {len(guesses)} x {len(answers)} patterns to: {args.output}")
@@ -0,0 +1,168 @@
+import argparse
+import json
+import mmap
+import os
+from typing import Dict, List, Sequence, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+# Placeholder for games that haven't been benchmarked yet
+NOT_PLAYED = 0
+# Turns recorded for games that weren't solved within the game length
+UNSOLVED = 255
+
+
+def results_path(mode: str = "turns-to-win") -> str:
+    return os.path.join(DATA_DIR, f"benchmark-results-{mode}.bin")
+
+
+def _metadata_path(path: str) -> str:
+    return f"{path}.json"
+
+
+def create_results_store(
+    path: str,
+    guesses: Sequence[str],
+    answers: Sequence[str],
+    mode: str,
+    total_steps: int = 6,
+):
+    """Create an empty guess-by-answer store of turns to solve, one byte each."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.truncate(len(guesses) * len(answers))
+    metadata = {
+        "mode": mode,
+        "total_steps": total_steps,
+        "guesses": list(guesses),
+        "answers": list(answers),
+    }
+    with open(_metadata_path(path), "w") as f:
+        json.dump(metadata, f)
+
+
+class ResultsStore:
+    """Memory-mapped, guess-by-answer matrix of turns to solve each game.
+
+    Rows are first guesses and columns are answers, with one byte per game:
+    'NOT_PLAYED', the number of turns, or 'UNSOLVED'.  Queries read the mapped
+    file directly, so opening even a full sweep is instant.
+    """
+
+    def __init__(self, path: str, writable: bool = False):
+        with open(_metadata_path(path), "r") as f:
+            metadata = json.load(f)
+        self.mode: str = metadata["mode"]
+        self.total_steps: int = metadata["total_steps"]
+        self.guesses: Tuple[str, ...] = tuple(metadata["guesses"])
+        self.answers: Tuple[str, ...] = tuple(metadata["answers"])
+        self.guess_index: Dict[str, int] = {g: i for i, g in enumerate(self.guesses)}
+        self.answer_index: Dict[str, int] = {a: j for j, a in enumerate(self.answers)}
+
+        self._file = open(path, "r+b" if writable else "rb")
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+    def write_row(self, guess: str, turns: Sequence[int]):
+        """Record the turns for every answer, in the store's answer order."""
+        offset = self.guess_index[guess] * len(self.answers)
+        self._mmap[offset : offset + len(self.answers)] = bytes(turns)
+
+    def turns(self, guess: str) -> bytes:
+        """Turns to solve each answer, starting from a first guess."""
+        offset = self.guess_index[guess] * len(self.answers)
+        return self._mmap[offset : offset + len(self.answers)]
+
+    def column(self, answer: str) -> bytes:
+        """Turns to solve one answer, for every first guess."""
+        num_answers = len(self.answers)
+        j = self.answer_index[answer]
+        return self._mmap[j : len(self.guesses) * num_answers : num_answers]
+
+    def played(self) -> List[str]:
+        """First guesses that have been benchmarked."""
+        return [g for g in self.guesses if self.turns(g).count(NOT_PLAYED) == 0]
+
+    def distribution(self, guess: str) -> Dict[str, int]:
+        """Number of games solved in each number of turns, and unsolved ('X')."""
+        row = self.turns(guess)
+        counts = {str(t): row.count(t) for t in range(1, UNSOLVED)}
+        counts["X"] = row.count(UNSOLVED)
+        return {k: v for k, v in counts.items() if v}
+
+    def failures(self, guess: str) -> List[str]:
+        """Answers that weren't solved, starting from a first guess."""
+        row = self.turns(guess)
+        return [a for a, t in zip(self.answers, row) if t == UNSOLVED]
+
+    def summary(self, guess: str) -> Dict:
+        """Same statistics as 'data/benchmarks.jsonl', for one first guess."""
+        row = self.turns(guess)
+        num_unsolved = row.count(UNSOLVED)
+        # Unsolved games count as every turn played, like the solver benchmark
+        total_turns = sum(row) - num_unsolved * (UNSOLVED - self.total_steps)
+        return {
+            "first_guess": guess,
+            "mode": self.mode,
+            "win_percentage": (len(row) - num_unsolved) / len(row),
+            "average_turns": total_turns / len(row),
+            "max_turns": self.total_steps if num_unsolved else max(row),
+        }
+
+    def hardest_answers(self, n: int = 10) -> List[Dict]:
+        """Answers failed most often over the benchmarked first guesses, and then
+        those with the most turns to solve.
+        """
+        rows = [self.guess_index[g] for g in self.played()]
+        if not rows:
+            return []
+        results = []
+        for answer in self.answers:
+            column = self.column(answer)
+            turns = [column[i] for i in rows]
+            solved = [t for t in turns if t != UNSOLVED]
+            results.append(
+                {
+                    "answer": answer,
+                    "failures": len(turns) - len(solved),
+                    "average_turns": sum(solved) / max(len(solved), 1),
+                }
+            )
+        results.sort(key=lambda r: (r["failures"], r["average_turns"]), reverse=True)
+        return results[:n]
+
+
+def main_query_results():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "query", type=str, choices=["summary", "distribution", "failures", "hardest"]
+    )
+    parser.add_argument("--first-guess", type=str, default=None)
+    parser.add_argument("--mode", type=str, default="turns-to-win")
+    parser.add_argument("--path", type=str, default=None)
+    parser.add_argument("-n", type=int, default=10)
+    args = parser.parse_args()
+
+    path = args.path or results_path(args.mode)
+    with ResultsStore(path) as store:
+        if args.query == "hardest":
+            result = store.hardest_answers(args.n)
+        elif args.first_guess is None:
+            raise ValueError(f"Query '{args.query}' requires '--first-guess'.")
+        elif args.query == "summary":
+            result = store.summary(args.first_guess)
+        elif args.query == "distribution":
+            result = store.distribution(args.first_guess)
+        else:
+            result = store.failures(args.first_guess)
+
+    print(json.dumps(result, indent=2))
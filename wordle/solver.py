@@ -1,22 +1,48 @@
 from __future__ import annotations
-from copy import deepcopy
 
 import argparse
+import heapq
+import json
+import os
+import sys
+import time
 from argparse import ArgumentParser
-from collections import Counter
+from array import array
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextvars import ContextVar
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from functools import lru_cache
-from math import perm, prod
-from typing import Dict, List, Optional, Sequence, Tuple, Union
-
-from wordle.data import load_all_words, load_words
+from itertools import chain
+from math import log2, perm, prod
+from operator import itemgetter
+from string import ascii_lowercase
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from wordle.cost_model import calibrate, load_cost_model, save_cost_model
+from wordle.data import WORD_LENGTH, load_all_words, load_fallback_words, load_words
 from wordle.game import LetterEvaluation, WordleStepInfo, _evaluate_guess
+from wordle.tree import DecisionTree, load_decision_tree, load_opening_book
 
 
 @dataclass
 class WordRecommendations:
     recommended: Optional[str]
     alternatives: Sequence[str] = ()
+    # Name of the ranker that produced the recommendation
+    tier: Optional[str] = None
 
     def __str__(self) -> str:
         return (
@@ -25,16 +51,67 @@ class WordRecommendations:
         )
 
 
+class WordRanking(Sequence[str]):
+    """Words ordered by ascending score, sorted lazily.
+
+    The top words are found by partial selection, and the full order is only
+    materialized when it is actually needed (e.g. by iterating over all words).
+    Ties keep the insertion order of 'scores'.
+    """
+
+    def __init__(self, scores: Dict[str, Any]):
+        self.scores = scores
+        self.words = tuple(scores)
+        self._top: Tuple[str, ...] = ()
+        self._ordered: Optional[Tuple[str, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ordered())
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore
+        if isinstance(index, slice):
+            start, stop, step = index.start or 0, index.stop, index.step
+            if stop is not None and start >= 0 and stop >= 0 and step is None:
+                return self.top(stop)[start:]
+            return self.ordered()[index]
+        elif index >= 0:
+            return self.top(index + 1)[index]
+        else:
+            return self.ordered()[index]
+
+    def top(self, k: int) -> Tuple[str, ...]:
+        """The 'k' best-scored words, in order."""
+        # Rankings are shared through caches, so only read the lazy fields once.
+        # Concurrent callers may duplicate work, but never see a partial result.
+        ordered = self._ordered
+        if ordered is not None:
+            return ordered[:k]
+        top = self._top
+        if k > len(top) and len(top) < len(self.words):
+            top = tuple(heapq.nsmallest(k, self.words, key=self.scores.get))
+            self._top = top
+        return top[:k]
+
+    def ordered(self) -> Tuple[str, ...]:
+        """All words, in order."""
+        ordered = self._ordered
+        if ordered is None:
+            ordered = tuple(sorted(self.words, key=self.scores.get))
+            self._ordered = ordered
+        return ordered
+
+
 @lru_cache(maxsize=2048)
 def _cached_counter(word: str) -> Dict[str, int]:
     return Counter(word)
 
 
 @lru_cache(maxsize=2048)
-def _rank_by_chain_prob(words: Tuple[str, ...]) -> Tuple[str, ...]:
-    word_set = set(words)
-    probs = {w: _word_prob(w, words) for w in word_set}
-    return tuple(w for w in sorted(word_set, key=lambda w: -probs[w]))
+def _rank_by_chain_prob(words: Tuple[str, ...]) -> WordRanking:
+    return WordRanking({w: -p for w, p in _word_probs(words).items()})
 
 
 def _character_prob(char: str, options: Union[str, Tuple[str, ...]]) -> float:
@@ -57,37 +134,213 @@ def _word_prob(word: str, options: Tuple[str, ...]) -> float:
     )
 
 
+def _word_probs(options: Tuple[str, ...]) -> Dict[str, float]:
+    """Same as '_word_prob' for every unique option, counting letters only once."""
+    if not options:
+        return {}
+    positional_counts = [Counter(o) for o in zip(*options)]
+    overall_counts = Counter("".join(options))
+    num_options, num_chars = len(options), sum(len(o) for o in options)
+
+    probs: Dict[str, float] = {}
+    for word in dict.fromkeys(options):
+        counts = _cached_counter(word)
+        probs[word] = prod(
+            (pc[c] / num_options)
+            * (overall_counts[c] / num_chars)
+            / perm(counts[c]) ** 2
+            for c, pc in zip(word, positional_counts)
+        )
+    return probs
+
+
 @lru_cache(maxsize=2048)
-def _rank_by_average_split(words: Tuple[str, ...]) -> Tuple[str, ...]:
-    avg_words = {w: _avg_words_after_guess(w, words) for w in words}
-    return tuple(w for w in sorted(words, key=lambda w: avg_words[w]))
+def _rank_by_average_split(words: Tuple[str, ...]) -> WordRanking:
+    return WordRanking({w: _avg_words_after_guess(w, words) for w in words})
 
 
 @lru_cache(maxsize=2048)
-def _rank_by_maximum_split(words: Tuple[str, ...]) -> Tuple[str, ...]:
-    avg_words = {w: _max_words_after_guess(w, words) for w in words}
-    return tuple(w for w in sorted(words, key=lambda w: avg_words[w]))
+def _rank_by_maximum_split(words: Tuple[str, ...]) -> WordRanking:
+    return WordRanking({w: _max_words_after_guess(w, words) for w in words})
 
 
 @lru_cache(maxsize=65536)
 def _eval_pattern(guess: str, truth: str) -> int:
-    """Compact evaluation pattern as a base-3 integer in [0, 243)."""
+    """Compact evaluation pattern as a base-3 integer in [0, 3 ** len(guess))."""
     remaining: dict = {}
     for c in truth:
         remaining[c] = remaining.get(c, 0) + 1
 
-    result = [0, 0, 0, 0, 0]
-    for i in range(5):
+    n = len(guess)
+    result = [0] * n
+    for i in range(n):
         if guess[i] == truth[i]:
             result[i] = 2
             remaining[guess[i]] -= 1
 
-    for i in range(5):
+    # Yellows are assigned left to right, so each digit is final once it's reached
+    pattern = 0
+    for i in range(n):
         if result[i] == 0 and remaining.get(guess[i], 0) > 0:
             result[i] = 1
             remaining[guess[i]] -= 1
+        pattern = 3 * pattern + result[i]
+
+    return pattern
+
+
+def _all_green_pattern(word_length: int) -> int:
+    return 3**word_length - 1
+
+
+ALL_GREEN_PATTERN = _all_green_pattern(5)
+
+
+def _pattern_typecode(word_length: int) -> str:
+    """Smallest array typecode that holds every pattern code for a word length.
+
+    That's one byte per code up to 5 letters (3 ** 5 = 243 codes), two bytes up
+    to 10 letters (3 ** 10 = 59049), and four bytes beyond.
+    """
+    if word_length <= 5:
+        return "B"
+    elif word_length <= 10:
+        return "H"
+    return "I"
+
+
+def _pack_patterns(patterns: Iterable[int], word_length: int) -> Sequence[int]:
+    """Pattern codes in the smallest integer type that holds them."""
+    typecode = _pattern_typecode(word_length)
+    if typecode == "B":
+        return bytes(patterns)
+    return array(typecode, patterns)
+
+
+def _pattern_from_step_info(info: WordleStepInfo) -> int:
+    """Evaluation pattern of a step, in the same encoding as '_eval_pattern'."""
+    pattern = 0
+    for letter in info.letters:
+        value = 2 if letter.in_correct_position else 1 if letter.in_word else 0
+        pattern = 3 * pattern + value
+    return pattern
+
+
+# Feedback characters for each letter, by base-3 pattern value
+FEEDBACK_VALUES = {
+    "b": 0,
+    "x": 0,
+    "-": 0,
+    ".": 0,
+    "⬛": 0,
+    "⬜": 0,
+    "y": 1,
+    "🟨": 1,
+    "g": 2,
+    "🟩": 2,
+}
+# A game state is the sequence of '(guess, pattern)' steps played so far
+State = Tuple[Tuple[str, int], ...]
+
+
+def _parse_feedback(feedback: str) -> int:
+    pattern = 0
+    for c in feedback.lower():
+        if c not in FEEDBACK_VALUES:
+            raise ValueError(f"Unknown feedback character '{c}' in '{feedback}'.")
+        pattern = 3 * pattern + FEEDBACK_VALUES[c]
+    return pattern
+
+
+def _step_info_from_pattern(guess: str, pattern: int, step: int) -> WordleStepInfo:
+    values = []
+    for _ in guess:
+        values.append(pattern % 3)
+        pattern //= 3
+    # Patterns are most significant first, like '_eval_pattern'
+    letters = tuple(
+        LetterEvaluation(text=c, in_word=v > 0, in_correct_position=v == 2)
+        for c, v in zip(guess, reversed(values))
+    )
+    success = all(v == 2 for v in values)
+    return WordleStepInfo(step=step, letters=letters, success=success)
+
+
+def _check_word(word: str, word_length: int, name: str):
+    if not (isinstance(word, str) and word.isascii() and word.isalpha()):
+        raise ValueError(f"Invalid {name} {word!r}, expected a word of letters.")
+    if len(word) != word_length:
+        raise ValueError(
+            f"Invalid {name} '{word}', expected {word_length} letters "
+            f"but got {len(word)}."
+        )
+
+
+def _steps_from_record(
+    record: Dict, word_length: Optional[int] = None
+) -> List[Tuple[str, int]]:
+    """'(guess, pattern)' steps of a game record.
+
+    Records contain 'guesses', and either 'feedback' strings (one character per
+    letter, like "bygbb" or "⬛🟨🟩⬛⬛") or the game's 'answer'.  Every guess must
+    have 'word_length' letters (by default, as many as the first guess), and
+    there must be exactly one feedback string per guess.
+    """
+    guesses = [g.lower() for g in record["guesses"]]
+    if word_length is None:
+        word_length = len(guesses[0]) if guesses else WORD_LENGTH
+    for guess in guesses:
+        _check_word(guess, word_length, "guess")
+
+    if "feedback" in record:
+        feedback = list(record["feedback"])
+        if len(feedback) != len(guesses):
+            raise ValueError(
+                f"Expected one feedback string per guess, but got {len(feedback)} "
+                f"for {len(guesses)} guesses."
+            )
+        for guess, f in zip(guesses, feedback):
+            if len(f) != len(guess):
+                raise ValueError(f"Feedback '{f}' doesn't match guess '{guess}'.")
+        patterns = [_parse_feedback(f) for f in feedback]
+    else:
+        answer = record["answer"].lower()
+        _check_word(answer, word_length, "answer")
+        patterns = [_eval_pattern(g, answer) for g in guesses]
+    return list(zip(guesses, patterns))
+
+
+def _collapse_guesses(
+    guesses: Iterable[str], words: Sequence[str]
+) -> Dict[str, List[str]]:
+    """Group guesses that are certain to have the same patterns against 'words'.
+
+    Letters that appear in none of the words always evaluate as absent, and don't
+    change how the other letters are evaluated.  So guesses that only differ in
+    those letters are equivalent, and only one of each class needs scoring.
+    Classes are keyed by their first guess.
+    """
+    live = set(chain.from_iterable(words))
+    mask = str.maketrans({c: "." for c in ascii_lowercase if c not in live})
+    classes: Dict[str, List[str]] = {}
+    for guess in guesses:
+        classes.setdefault(guess.translate(mask), []).append(guess)
+    return {members[0]: members for members in classes.values()}
+
+
+@lru_cache(maxsize=2048)
+def _pattern_row(guess: str, words: Tuple[str, ...]) -> Sequence[int]:
+    """Evaluation patterns of a guess against every word, packed by word length."""
+    # Skip the pairwise cache, which would only be flooded by whole rows
+    eval_pattern = _eval_pattern.__wrapped__
+    return _pack_patterns((eval_pattern(guess, w) for w in words), len(guess))
+
 
-    return result[0] * 81 + result[1] * 27 + result[2] * 9 + result[3] * 3 + result[4]
+def _indexed_patterns(row: Sequence[int], indices: Sequence[int]) -> Sequence[int]:
+    """Patterns from a row at the given word indices."""
+    if len(indices) == 1:
+        return (row[indices[0]],)
+    return itemgetter(*indices)(row)
 
 
 def _partition_buckets(guess: str, words: Tuple[str, ...]) -> Dict[int, int]:
@@ -109,10 +362,87 @@ def _max_words_after_guess(guess: str, words: Tuple[str, ...]) -> float:
     return max(buckets.values())
 
 
+def _entropy_after_guess(guess: str, words: Tuple[str, ...]) -> float:
+    """Expected information (in bits) revealed by the evaluation of a guess."""
+    buckets = _partition_buckets(guess, words)
+    total = len(words)
+    return -sum(c / total * log2(c / total) for c in buckets.values())
+
+
 @lru_cache(maxsize=2048)
-def _rank_by_exhaustive_search(words: Tuple[str, ...]) -> Tuple[str, ...]:
-    turns = {w: _avg_turns_to_win(w, words) for w in words}
-    return tuple(w for w in sorted(words, key=lambda w: turns[w]))
+def _rank_by_entropy(words: Tuple[str, ...]) -> WordRanking:
+    return WordRanking({w: -_entropy_after_guess(w, words) for w in words})
+
+
+LOOKAHEAD_TOP_K = 16
+# Above this size, only the most probable words are considered as first guesses
+LOOKAHEAD_MAX_POOL = 256
+
+
+def _partition_words(guess: str, words: Tuple[str, ...]) -> Dict[int, Tuple[str, ...]]:
+    """Split words into evaluation-pattern buckets for a given guess."""
+    buckets: Dict[int, List[str]] = {}
+    for word in words:
+        buckets.setdefault(_eval_pattern(guess, word), []).append(word)
+    return {p: tuple(bucket) for p, bucket in buckets.items()}
+
+
+@lru_cache(maxsize=65536)
+def _best_avg_words_in_bucket(words: Tuple[str, ...]) -> float:
+    """Smallest expected number of remaining words after one more guess.
+
+    Cached by bucket, since different first guesses often leave identical
+    buckets behind.
+    """
+    if len(words) <= 2:
+        return 1.0
+
+    # Score all second guesses from one pass over the pairwise patterns
+    counts: List[Dict[int, int]] = [{} for _ in words]
+    for i, guess in enumerate(words):
+        buckets = counts[i]
+        for word in words:
+            p = _eval_pattern(guess, word)
+            buckets[p] = buckets.get(p, 0) + 1
+
+    best = min(sum(c * c for c in buckets.values()) for buckets in counts)
+    return best / len(words)
+
+
+def _avg_words_after_two_guesses(guess: str, words: Tuple[str, ...]) -> float:
+    """Expected number of remaining words, if the best second guess is played
+    for each evaluation pattern of the first guess."""
+    buckets = _partition_words(guess, words)
+    total = sum(len(b) * _best_avg_words_in_bucket(b) for b in buckets.values())
+    return total / len(words)
+
+
+@lru_cache(maxsize=2048)
+def _rank_by_lookahead(
+    words: Tuple[str, ...], top_k: int = LOOKAHEAD_TOP_K
+) -> WordRanking:
+    by_prob = _rank_by_chain_prob(words)
+    if len(words) > LOOKAHEAD_MAX_POOL:
+        pool = by_prob.top(LOOKAHEAD_MAX_POOL)
+    else:
+        pool = words
+
+    one_ply = WordRanking({w: _avg_words_after_guess(w, words) for w in pool})
+    # Two-ply scores for the top guesses, then one-ply scores for the rest of
+    # the pool, then probability for everything else
+    scores: Dict[str, Tuple[int, float]] = {
+        w: (0, _avg_words_after_two_guesses(w, words)) for w in one_ply.top(top_k)
+    }
+    for w in pool:
+        scores.setdefault(w, (1, one_ply.scores[w]))
+    for w in by_prob.words:
+        scores.setdefault(w, (2, by_prob.scores[w]))
+    return WordRanking(scores)
+
+
+@lru_cache(maxsize=2048)
+def _rank_by_exhaustive_search(words: Tuple[str, ...]) -> WordRanking:
+    return WordRanking({w: _avg_turns_to_win(w, words) for w in words})
 
 
 def _num_turns_to_win(truth: str, guess: Optional[str], words: Tuple[str, ...]) -> int:
@@ -131,18 +461,38 @@ def _num_turns_to_win(truth: str, guess: Optional[str], words: Tuple[str, ...])
     return step
 
 
-def _avg_turns_to_win(guess: str, words: Tuple[str, ...]) -> float:
-    return max(_num_turns_to_win(w, guess, words) for w in words)
+class _DeadlineExceeded(Exception):
+    """Raised by the exhaustive search when its deadline (if any) has passed."""
+
 
+# Deadline for the exhaustive search in the current thread, if any.  A context
+# variable, because the search recurses through cached rankings, and the
+# deadline must not become part of their cache keys.
+_search_deadline: ContextVar[Optional[float]] = ContextVar(
+    "_search_deadline", default=None
+)
 
-def _rank_by_turns_to_win(words: Tuple[str, ...]) -> Tuple[str, ...]:
+
+def _avg_turns_to_win(guess: str, words: Tuple[str, ...]) -> float:
+    deadline = _search_deadline.get()
+    turns = 0
+    for w in words:
+        # Checked at every level of the search.  Rankings that were interrupted
+        # aren't cached, but all finished sub-searches are.
+        if deadline is not None and time.perf_counter() > deadline:
+            raise _DeadlineExceeded()
+        turns = max(turns, _num_turns_to_win(w, guess, words))
+    return turns
+
+
+def _rank_by_turns_to_win(words: Tuple[str, ...]) -> WordRanking:
     if len(words) > 128:
         return _rank_by_chain_prob(words)
     else:
         return _rank_by_average_split(words)
 
 
-def _rank_by_win_percentage(words: Tuple[str, ...]) -> Tuple[str, ...]:
+def _rank_by_win_percentage(words: Tuple[str, ...]) -> WordRanking:
     if len(words) > 128:
         return _rank_by_chain_prob(words)
     elif len(words) > 32:
@@ -151,71 +501,680 @@ def _rank_by_win_percentage(words: Tuple[str, ...]) -> Tuple[str, ...]:
         return _rank_by_exhaustive_search(words)
 
 
+@dataclass(frozen=True)
+class AnytimeTier:
+    name: str
+    # Takes '(guess, words)', and lower is better
+    score_fn: Callable[[str, Tuple[str, ...]], float]
+    # Only rescore this many of the top words from the previous tier
+    top_k: Optional[int] = None
+    # Skip this tier for larger word sets, where even one score is too slow
+    max_words: Optional[int] = None
+
+
+# Refinement tiers for deadline-aware ranking, from cheapest to most expensive
+ANYTIME_TIERS: Tuple[AnytimeTier, ...] = (
+    AnytimeTier("avg-split", _avg_words_after_guess),
+    AnytimeTier("entropy", lambda guess, words: -_entropy_after_guess(guess, words)),
+    AnytimeTier("lookahead", _avg_words_after_two_guesses, top_k=LOOKAHEAD_TOP_K),
+    AnytimeTier("exhaustive", _avg_turns_to_win, max_words=32),
+)
+
+
+def _score_before_deadline(
+    score_fn: Callable[[str, Tuple[str, ...]], float],
+    guesses: Sequence[str],
+    words: Tuple[str, ...],
+    deadline: float,
+    estimate: float = 0.0,
+) -> Optional[Dict[str, float]]:
+    """Score every guess, or return None if the deadline would be exceeded.
+
+    Scoring is abandoned before starting a guess that is not expected to finish
+    in time, based on how long the previous guess took ('estimate' seconds for
+    the first guess).  Scores that can stop early (like the exhaustive search)
+    are also abandoned as soon as the deadline passes.
+    """
+    scores: Dict[str, float] = {}
+    elapsed = estimate
+    token = _search_deadline.set(deadline)
+    try:
+        for guess in guesses:
+            start = time.perf_counter()
+            if start + elapsed > deadline:
+                return None
+            scores[guess] = score_fn(guess, words)
+            elapsed = time.perf_counter() - start
+    except _DeadlineExceeded:
+        return None
+    finally:
+        _search_deadline.reset(token)
+
+    return scores
+
+
+def _rank_before_deadline(
+    words: Tuple[str, ...], deadline: float
+) -> Tuple[WordRanking, str]:
+    """Rank words by the most expensive tier that finishes before the deadline.
+
+    The cheap 'probability' ranking is always computed, so there is an answer
+    even if the deadline has already passed.  Ties within each tier are broken
+    by the ranking of the previous tier.
+    """
+    ranked = _rank_by_chain_prob(words)
+    tier = "probability"
+    if len(words) <= 1:
+        return ranked, tier
+
+    model = load_cost_model()
+    # Seconds per guess in the previous tier, a lower bound for the next tier
+    per_guess = 0.0
+    for t in ANYTIME_TIERS:
+        if t.max_words is not None and len(words) > t.max_words:
+            break
+        head = ranked.words if t.top_k is None else ranked.top(t.top_k)
+        estimate = per_guess
+        if model is not None and t.name in model.coefficients:
+            predicted_ms = model.predict_ms(t.name, len(words))
+            remaining_ms = 1000 * (deadline - time.perf_counter())
+            if predicted_ms > remaining_ms:
+                break
+            estimate = max(estimate, predicted_ms / 1000 / len(head))
+
+        start = time.perf_counter()
+        scores = _score_before_deadline(
+            t.score_fn, head, words, deadline, estimate=estimate
+        )
+        if scores is None:
+            break
+        per_guess = (time.perf_counter() - start) / len(head)
+        ranked = WordRanking(
+            {
+                w: (0, scores[w], s) if w in scores else (1, s)
+                for w, s in ranked.scores.items()
+            }
+        )
+        tier = t.name
+
+    return ranked, tier
+
+
+# First guess and alternatives for each solver mode
+OPENINGS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "win-percentage": ("ralph", ("blast", "plush")),
+}
+DEFAULT_OPENING = ("slate", ("blast", "tapir", "ralph"))
+
+
+def _opening(mode: str, word_length: int = WORD_LENGTH) -> Tuple[str, Tuple[str, ...]]:
+    if word_length == WORD_LENGTH:
+        return OPENINGS.get(mode, DEFAULT_OPENING)
+    # Openers are only tuned for 5-letter words.  Otherwise, ranking the whole
+    # list by splits would be the slowest step of every game, so open with the
+    # most probable words instead.
+    top = _rank_by_chain_prob(load_words(word_length)).top(4)
+    return top[0], top[1:]
+
+
+DEFAULT_LATENCY_BUDGET_MS = 10.0
+# Rankers that can be selected by the calibrated cost model ('auto' mode),
+# ordered from least to most accurate.
+CALIBRATED_RANKERS: Dict[str, Callable[[Tuple[str, ...]], WordRanking]] = {
+    "probability": _rank_by_chain_prob,
+    "avg-split": _rank_by_average_split,
+    "entropy": _rank_by_entropy,
+    "lookahead": _rank_by_lookahead,
+    "exhaustive": _rank_by_exhaustive_search,
+}
+
+
+def _rank_by_cost_model(
+    words: Tuple[str, ...], budget_ms: float
+) -> Tuple[WordRanking, str]:
+    """Rank with the most accurate ranker expected to finish within the budget.
+
+    Without a calibrated cost model (see 'calibrate-wordle'), this falls back to
+    the fixed size thresholds of 'turns-to-win' mode.
+    """
+    model = load_cost_model()
+    if model is None:
+        return _rank_by_turns_to_win(words), "turns-to-win"
+
+    names = tuple(CALIBRATED_RANKERS.keys())
+    name = model.select(names, len(words), budget_ms) or names[0]
+    return CALIBRATED_RANKERS[name](words), name
+
+
+class FallbackPool:
+    """Valid guesses that are not possible answers, filtered lazily.
+
+    The pool starts from one shared, immutable tuple of words.  Step infos are
+    only recorded by 'update', and the ones not yet applied are used to filter
+    the pool when 'words' is actually read.
+    """
+
+    def __init__(self, words: Optional[Tuple[str, ...]] = None):
+        self._words = load_fallback_words() if words is None else words
+        self._pending: List[WordleStepInfo] = []
+
+    def update(self, step_info: WordleStepInfo):
+        self._pending.append(step_info)
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        for info in self._pending:
+            self._words = _filter_words_from_step_info(self._words, info)
+        self._pending.clear()
+        return self._words
+
+    def copy(self) -> FallbackPool:
+        pool = FallbackPool(self._words)
+        pool._pending = list(self._pending)
+        return pool
+
+
+@lru_cache(maxsize=None)
+def _word_index(word_length: int) -> Dict[str, int]:
+    return {w: i for i, w in enumerate(load_words(word_length))}
+
+
+def _index_typecode(word_length: int) -> str:
+    return "H" if len(load_words(word_length)) <= 2**16 else "I"
+
+
+@lru_cache(maxsize=None)
+def _all_candidates(word_length: int) -> bytes:
+    num_words = len(load_words(word_length))
+    return array(_index_typecode(word_length), range(num_words)).tobytes()
+
+
+@dataclass(frozen=True)
+class SolverState:
+    """Immutable snapshot of a 'WordleSolver'.
+
+    Candidate words are stored as packed indices into the shared word list, so
+    a snapshot takes a few hundred bytes after the first guess.  The fallback
+    pool and any decision tree position are rebuilt from the history.
+    """
+
+    mode: str
+    word_length: int
+    history: State
+    candidates: bytes
+    time_budget_ms: Optional[float] = None
+    use_opening_book: bool = True
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        vocabulary = load_words(self.word_length)
+        if self.candidates == _all_candidates(self.word_length):
+            # Share the word list itself, rather than an equal copy
+            return vocabulary
+        indices = array(_index_typecode(self.word_length), self.candidates)
+        return tuple(vocabulary[i] for i in indices)
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps(
+            [
+                self.mode,
+                self.word_length,
+                self.time_budget_ms,
+                self.use_opening_book,
+                self.history,
+            ],
+            separators=(",", ":"),
+        ).encode()
+        return len(header).to_bytes(4, "little") + header + self.candidates
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> SolverState:
+        size = int.from_bytes(data[:4], "little")
+        mode, word_length, time_budget_ms, use_opening_book, history = json.loads(
+            data[4 : 4 + size]
+        )
+        return cls(
+            mode=mode,
+            word_length=word_length,
+            history=tuple((guess, pattern) for guess, pattern in history),
+            candidates=bytes(data[4 + size :]),
+            time_budget_ms=time_budget_ms,
+            use_opening_book=use_opening_book,
+        )
+
+    def __reduce__(self):
+        # Pickle (e.g. for worker processes) as the compact encoding
+        return (SolverState.from_bytes, (self.to_bytes(),))
+
+
 class WordleSolver:
-    def __init__(self, mode: str = "turns-to-win"):
+    def __init__(
+        self,
+        mode: str = "turns-to-win",
+        time_budget_ms: Optional[float] = None,
+        decision_tree: Optional[DecisionTree] = None,
+        use_opening_book: bool = True,
+        word_length: int = WORD_LENGTH,
+    ):
         self.mode = mode
-        self.words = load_words()
-        primary_set = set(self.words)
-        self.fallback_words = tuple(w for w in load_all_words() if w not in primary_set)
+        self.word_length = word_length
+        self.time_budget_ms = time_budget_ms
+        # Precomputed guesses are followed for as long as the game stays on them
+        self.tree_node = decision_tree
+        self.tree_source = "tree"
+        self.use_opening_book = use_opening_book
+        # Candidate words, and their ranking from the latest recommendation
+        self.ranking: Optional[WordRanking] = None
+        self.words = load_words(word_length)
+        self.fallback = FallbackPool(load_fallback_words(word_length))
+        self.history: State = ()
+
+    @classmethod
+    def from_state(
+        cls, state: SolverState, decision_tree: Optional[DecisionTree] = None
+    ) -> WordleSolver:
+        """Rebuild a solver from a snapshot, against the shared word lists.
+
+        Pass the same 'decision_tree' as the original solver (if any) to resume
+        following it.
+        """
+        solver = cls(
+            mode=state.mode,
+            time_budget_ms=state.time_budget_ms,
+            decision_tree=decision_tree,
+            use_opening_book=state.use_opening_book,
+            word_length=state.word_length,
+        )
+        for step, (guess, pattern) in enumerate(state.history, 1):
+            info = _step_info_from_pattern(guess, pattern, step=step)
+            solver._follow_tree(info, pattern, first_step=step == 1)
+            solver.fallback.update(info)
+        solver.words = state.words
+        solver.history = state.history
+        return solver
+
+    def snapshot(self) -> SolverState:
+        """Immutable, compact copy of the solver's state (see 'from_state')."""
+        index = _word_index(self.word_length)
+        candidates = array(
+            _index_typecode(self.word_length), map(index.get, self.words)
+        )
+        return SolverState(
+            mode=self.mode,
+            word_length=self.word_length,
+            history=self.history,
+            candidates=candidates.tobytes(),
+            time_budget_ms=self.time_budget_ms,
+            use_opening_book=self.use_opening_book,
+        )
 
-    def recommend(self, max_alternatives: int = 5) -> WordRecommendations:
-        if len(self.words) == len(load_words()):
-            if self.mode == "win-percentage":
-                return WordRecommendations(
-                    recommended="ralph",
-                    alternatives=["blast", "plush"],
-                )
-            else:
-                return WordRecommendations(
-                    recommended="slate",
-                    alternatives=["blast", "tapir", "ralph"],
-                )
+    def fork(self) -> WordleSolver:
+        """Copy that can be updated independently of this solver.
+
+        Word tuples, history and the decision tree are immutable, so they are
+        shared rather than copied.
+        """
+        child = copy(self)
+        child.ranking = None
+        child.fallback = self.fallback.copy()
+        return child
+
+    @property
+    def fallback_words(self) -> Tuple[str, ...]:
+        return self.fallback.words
+
+    def recommend(
+        self, max_alternatives: int = 5, time_budget_ms: Optional[float] = None
+    ) -> WordRecommendations:
+        """Recommend the next guess.
+
+        If 'time_budget_ms' is given (or was passed to the constructor), the
+        'mode' is ignored.  Instead, the cheapest ranking is computed first and
+        then refined by progressively more expensive rankers (see
+        'ANYTIME_TIERS') until the budget runs out.  The 'tier' field of the
+        result names the ranker that produced the final answer.
+
+        In 'auto' mode, a single ranker is chosen up front from the calibrated
+        cost model, and 'time_budget_ms' is the per-step latency budget.
+
+        On a decision tree or opening book, the alternatives are those stored
+        with the node, or else the top of the opener or live ranking.
+        """
+        start = time.perf_counter()
+        if time_budget_ms is None:
+            time_budget_ms = self.time_budget_ms
+
+        node = self.tree_node
+        if node is not None:
+            alternatives = list(node.alternatives[:max_alternatives])
+            if max_alternatives > 0 and not alternatives:
+                if len(self.words) == len(load_words(self.word_length)):
+                    opening, others = _opening(self.mode, self.word_length)
+                    top = [opening, *others]
+                else:
+                    ranking, _ = self._rank(start, time_budget_ms)
+                    top = ranking.top(max_alternatives + 1)
+                alternatives = [w for w in top if w != node.guess][:max_alternatives]
+            return WordRecommendations(
+                recommended=node.guess, alternatives=alternatives, tier=self.tree_source
+            )
 
-        words = self.words if self.words else self.fallback_words
+        if len(self.words) == len(load_words(self.word_length)):
+            guess, alternatives = _opening(self.mode, self.word_length)
+            return WordRecommendations(
+                recommended=guess, alternatives=list(alternatives), tier="opening"
+            )
 
-        if self.mode == "win-percentage":
-            words = _rank_by_win_percentage(words)
+        ranking, tier = self._rank(start, time_budget_ms)
+        self.ranking = ranking
+        top = ranking.top(max_alternatives + 1)
+        if len(top) > 0:
+            return WordRecommendations(
+                recommended=top[0], alternatives=top[1:], tier=tier
+            )
+        else:
+            return WordRecommendations(recommended=None, alternatives=(), tier=tier)
+
+    def _rank(
+        self, start: float, time_budget_ms: Optional[float]
+    ) -> Tuple[WordRanking, str]:
+        """Ranking of the candidate words, and the name of the ranker used."""
+        words = self.words if self.words else self.fallback.words
+        tier = self.mode
+
+        if self.mode == "auto":
+            if time_budget_ms is None:
+                time_budget_ms = DEFAULT_LATENCY_BUDGET_MS
+            ranking, tier = _rank_by_cost_model(words, time_budget_ms)
+        elif time_budget_ms is not None:
+            deadline = start + time_budget_ms / 1000
+            ranking, tier = _rank_before_deadline(words, deadline)
+        elif self.mode == "win-percentage":
+            ranking = _rank_by_win_percentage(words)
         elif self.mode == "turns-to-win":
-            words = _rank_by_turns_to_win(words)
+            ranking = _rank_by_turns_to_win(words)
         elif self.mode == "probability":
-            words = _rank_by_chain_prob(words)
+            ranking = _rank_by_chain_prob(words)
         elif self.mode == "avg-split":
-            words = _rank_by_average_split(words)
+            ranking = _rank_by_average_split(words)
         elif self.mode == "max-split":
-            words = _rank_by_maximum_split(words)
+            ranking = _rank_by_maximum_split(words)
+        elif self.mode == "entropy":
+            ranking = _rank_by_entropy(words)
+        elif self.mode == "lookahead":
+            ranking = _rank_by_lookahead(words)
         elif self.mode == "exhaustive":
-            words = _rank_by_exhaustive_search(words)
+            ranking = _rank_by_exhaustive_search(words)
         else:
             raise ValueError(f"Solver mode '{self.mode}' is not supported.")
 
-        if self.words:
-            self.words = words
-        else:
-            self.fallback_words = words
+        return ranking, tier
 
-        if len(words) > 0:
-            return WordRecommendations(
-                recommended=words[0],
-                alternatives=words[1 : max_alternatives + 1],
-            )
-        else:
-            return WordRecommendations(recommended=None, alternatives=())
+    def _follow_tree(self, step_info: WordleStepInfo, pattern: int, first_step: bool):
+        node = self.tree_node
+        if node is None and self.use_opening_book and first_step:
+            node = load_opening_book().get((self.mode, step_info.guess))
+            self.tree_source = "book"
+
+        if node is not None:
+            if step_info.guess == node.guess:
+                self.tree_node = node.children.get(pattern)
+            else:
+                self.tree_node = None
+
+    def filter(self, step_info: WordleStepInfo):
+        """Narrow down the candidate words, without recommending a guess."""
+        pattern = _pattern_from_step_info(step_info)
+        first_step = len(self.words) == len(load_words(self.word_length))
+        self._follow_tree(step_info, pattern, first_step=first_step)
 
-    def update(self, step_info: WordleStepInfo) -> Optional[str]:
         self.words = _filter_words_from_step_info(self.words, step_info)
-        self.fallback_words = _filter_words_from_step_info(
-            self.fallback_words, step_info
-        )
-        return self.recommend().recommended
+        self.fallback.update(step_info)
+        self.history += ((step_info.guess, pattern),)
+
+    def update(self, step_info: WordleStepInfo) -> Optional[str]:
+        self.filter(step_info)
+        # Only the guess is needed, so skip ranking alternatives on a tree
+        return self.recommend(max_alternatives=0).recommended
+
+
+# Answers that take longer than this are counted as unsolved by 'solver_turn_counts'
+MAX_EVALUATION_TURNS = 16
+
+
+def _branch(solver: WordleSolver, step_info: WordleStepInfo) -> WordleSolver:
+    """Copy of a solver after one more step, sharing all immutable state."""
+    child = solver.fork()
+    child.filter(step_info)
+    return child
+
+
+def _turn_counts(
+    solver: WordleSolver, step: int, guess: Optional[str], max_turns: int
+) -> Counter:
+    words = solver.words
+    if guess is None:
+        guess = solver.recommend(max_alternatives=0).recommended
+    if guess is None or step > max_turns:
+        return Counter({max_turns + 1: len(words)})
+
+    counts: Counter = Counter()
+    row = _pattern_row(guess, words)
+    for pattern, num_words in Counter(row).items():
+        if pattern == _all_green_pattern(len(guess)):
+            counts[step] += num_words
+        else:
+            info = _step_info_from_pattern(guess, pattern, step=step)
+            child = _branch(solver, info)
+            counts += _turn_counts(child, step + 1, None, max_turns)
+    return counts
+
+
+def solver_turn_counts(
+    solver: Optional[WordleSolver] = None,
+    first_guess: Optional[str] = None,
+    max_turns: int = MAX_EVALUATION_TURNS,
+) -> Dict[int, int]:
+    """Number of answers that a solver finds in each number of turns.
+
+    Rather than simulating a game per answer, the solver's decision tree is
+    expanded once: each distinct game state is recommended for exactly once, and
+    its candidates are split by pattern.  Answers not found within 'max_turns'
+    are counted under 'max_turns + 1'.
+    """
+    if solver is None:
+        solver = WordleSolver()
+    return dict(sorted(_turn_counts(solver, 1, first_guess, max_turns).items()))
+
+
+def worst_case_turns(
+    solver: Optional[WordleSolver] = None, first_guess: Optional[str] = None
+) -> int:
+    """Exact number of turns the solver needs for its hardest answer."""
+    return max(solver_turn_counts(solver, first_guess=first_guess))
+
+
+# Above this many distinct candidates, only the most probable words are scored
+# as guesses by the joint multi-board rankers
+JOINT_MAX_POOL = 256
+
+
+def _joint_guess_pool(boards: Tuple[Tuple[str, ...], ...]) -> Tuple[str, ...]:
+    words = tuple(chain.from_iterable(boards))
+    pool = tuple(dict.fromkeys(words))
+    if len(pool) > JOINT_MAX_POOL:
+        pool = _rank_by_chain_prob(words).top(JOINT_MAX_POOL)
+    return pool
+
+
+def _joint_partition_buckets(
+    guess: str, boards: Tuple[Tuple[str, ...], ...]
+) -> Dict[Tuple[int, int], int]:
+    """Count words in each (board, evaluation-pattern) bucket for a given guess."""
+    buckets: Dict[Tuple[int, int], int] = {}
+    for i, words in enumerate(boards):
+        for word in words:
+            key = (i, _eval_pattern(guess, word))
+            buckets[key] = buckets.get(key, 0) + 1
+    return buckets
+
+
+def _joint_avg_words_after_guess(
+    guess: str, boards: Tuple[Tuple[str, ...], ...]
+) -> float:
+    """Expected number of remaining words, summed over all boards.
+
+    A board is solved (zero words remain) if the guess is its answer.
+    """
+    squares = [0] * len(boards)
+    for (i, _), count in _joint_partition_buckets(guess, boards).items():
+        squares[i] += count * count
+    return sum(
+        (sq - (guess in words)) / len(words) for sq, words in zip(squares, boards)
+    )
+
+
+def _joint_entropy_after_guess(
+    guess: str, boards: Tuple[Tuple[str, ...], ...]
+) -> float:
+    """Expected information (in bits) revealed by a guess, summed over all boards."""
+    entropy = 0.0
+    for (i, _), count in _joint_partition_buckets(guess, boards).items():
+        p = count / len(boards[i])
+        entropy -= p * log2(p)
+    return entropy
+
+
+@lru_cache(maxsize=2048)
+def _rank_by_joint_split(boards: Tuple[Tuple[str, ...], ...]) -> WordRanking:
+    pool = _joint_guess_pool(boards)
+    return WordRanking({w: _joint_avg_words_after_guess(w, boards) for w in pool})
+
+
+@lru_cache(maxsize=2048)
+def _rank_by_joint_entropy(boards: Tuple[Tuple[str, ...], ...]) -> WordRanking:
+    pool = _joint_guess_pool(boards)
+    return WordRanking({w: -_joint_entropy_after_guess(w, boards) for w in pool})
+
+
+# Multi-board solvers switch to exact search once this few candidates remain
+ENDGAME_MAX_WORDS = 12
+
+
+def _endgame_outcomes(
+    guess: str, boards: Tuple[Tuple[str, ...], ...]
+) -> List[Tuple[float, Tuple[Tuple[str, ...], ...]]]:
+    """Joint outcomes of a guess across boards, as '(probability, boards)' pairs.
+
+    Boards are independent, and a board is dropped once the guess solves it.
+    """
+    outcomes: List[Tuple[float, Tuple[Tuple[str, ...], ...]]] = [(1.0, ())]
+    all_green = _all_green_pattern(len(guess))
+    for words in boards:
+        branches = [
+            (len(bucket) / len(words), () if p == all_green else (bucket,))
+            for p, bucket in _partition_words(guess, words).items()
+        ]
+        outcomes = [(p1 * p2, b1 + b2) for p1, b1 in outcomes for p2, b2 in branches]
+    return [(p, tuple(sorted(b))) for p, b in outcomes]
+
+
+def _endgame_lower_bound(boards: Tuple[Tuple[str, ...], ...]) -> float:
+    """Each board needs its own correct guess, unless boards share candidates."""
+    seen: set = set()
+    for words in boards:
+        if not seen.isdisjoint(words):
+            return 1.0
+        seen.update(words)
+    return float(len(boards))
+
+
+def _endgame_guess_scores(boards: Tuple[Tuple[str, ...], ...]) -> Dict[str, float]:
+    """Expected number of turns to solve all boards, after each candidate guess.
+
+    Guesses are tried in order of joint split, and outcomes from most to least
+    likely.  A guess is abandoned as soon as its lower bound reaches the best
+    score so far, and is then scored by that bound.  So only the best score is
+    exact, and the rest are lower bounds that are no better than the best.
+    """
+    guesses = _rank_by_joint_split(boards).ordered()
+    scores: Dict[str, float] = {}
+    best = float("inf")
+    for guess in guesses:
+        outcomes = _endgame_outcomes(guess, boards)
+        outcomes.sort(key=lambda o: -o[0])
+        bounds = [_endgame_lower_bound(b) for _, b in outcomes]
+        total = 1.0 + sum(p * lb for (p, _), lb in zip(outcomes, bounds))
+        for (p, b), lb in zip(outcomes, bounds):
+            if total >= best:
+                break
+            total += p * (_endgame_expected_turns(b) - lb)
+
+        scores[guess] = total
+        best = min(best, total)
+
+    return scores
+
+
+@lru_cache(maxsize=65536)
+def _endgame_expected_turns(boards: Tuple[Tuple[str, ...], ...]) -> float:
+    """Minimum expected number of turns to solve all boards, by exact search.
+
+    'boards' must be sorted (both the boards and their words), so that
+    equivalent joint states share the same cache entry.
+    """
+    if not boards:
+        return 0.0
+    return min(_endgame_guess_scores(boards).values())
+
+
+def _rank_by_endgame_search(boards: Tuple[Tuple[str, ...], ...]) -> WordRanking:
+    boards = tuple(sorted(tuple(sorted(words)) for words in boards))
+    return WordRanking(_endgame_guess_scores(boards))
+
+
+def _board_recommendations(
+    ranking: WordRanking,
+    boards: Tuple[Tuple[str, ...], ...],
+    max_alternatives: int,
+    tier: Optional[str] = None,
+) -> WordRecommendations:
+    # Boards with a single candidate left are solved by guessing it
+    solved = [words[0] for words in reversed(boards) if len(words) == 1]
+    top = tuple(dict.fromkeys(solved)) + tuple(
+        w for w in ranking.top(max_alternatives + 1 + len(solved)) if w not in solved
+    )
+    if len(top) == 0:
+        return WordRecommendations(recommended=None, alternatives=(), tier=tier)
+
+    return WordRecommendations(
+        recommended=top[0], alternatives=top[1 : max_alternatives + 1], tier=tier
+    )
 
 
 class MultiWordleSolver:
-    def __init__(self, num_words: int, mode: str = "probability"):
+    def __init__(
+        self,
+        num_words: int,
+        mode: str = "probability",
+        endgame_max_words: int = ENDGAME_MAX_WORDS,
+    ):
         self.num_words = num_words
         self.mode = mode
-        self.solvers = [WordleSolver(mode=mode) for _ in range(num_words)]
+        self.endgame_max_words = endgame_max_words
+        self.solvers = [WordleSolver() for _ in range(num_words)]
+        self.dones = [False] * num_words
         self._step = 1
 
+    @property
+    def live_boards(self) -> Tuple[Tuple[str, ...], ...]:
+        """Candidate words for each board that is not solved yet."""
+        return tuple(
+            solver.words
+            for solver, done in zip(self.solvers, self.dones)
+            if not done and solver.words
+        )
+
     def recommend(self, max_alternatives: int = 5) -> WordRecommendations:
         if self._step == 1:
             return WordRecommendations(
@@ -223,28 +1182,27 @@ class MultiWordleSolver:
                 alternatives=["blast", "tapir", "ralph"],
             )
 
-        words: Tuple[str, ...] = sum(
-            (solver.words for solver in self.solvers), start=tuple()
-        )
-        if self.mode == "probability":
-            words = _rank_by_chain_prob(words)
+        boards = self.live_boards
+        if sum(len(words) for words in boards) <= self.endgame_max_words:
+            ranking = _rank_by_endgame_search(boards)
+            return _board_recommendations(ranking, (), max_alternatives, "endgame")
+        elif self.mode == "probability":
+            ranking = _rank_by_chain_prob(tuple(chain.from_iterable(boards)))
+        elif self.mode == "joint-split":
+            ranking = _rank_by_joint_split(boards)
+        elif self.mode == "joint-entropy":
+            ranking = _rank_by_joint_entropy(boards)
         else:
             raise ValueError(f"Solver mode '{self.mode}' is not supported.")
 
-        for solver in self.solvers:
-            if len(solver.words) == 1:
-                word = solver.words[0]
-                words = (word,) + tuple(w for w in words if w != word)
-
-        return WordRecommendations(
-            recommended=words[0], alternatives=words[1 : max_alternatives + 1]
-        )
+        return _board_recommendations(ranking, boards, max_alternatives, self.mode)
 
     def update(self, step_info: Sequence[Optional[WordleStepInfo]]) -> Optional[str]:
         self._step += 1
-        for solver, info in zip(self.solvers, step_info):
+        for i, (solver, info) in enumerate(zip(self.solvers, step_info)):
             if info is not None:
-                solver.update(info)
+                solver.filter(info)
+                self.dones[i] = self.dones[i] or info.success
         return self.recommend().recommended
 
 
@@ -253,6 +1211,119 @@ class QuordleSolver(MultiWordleSolver):
         super().__init__(num_words=4, mode=mode)
 
 
+def _indexed_avg_words_after_guess(
+    row: Sequence[int], boards: Sequence[array]
+) -> float:
+    """Same as '_joint_avg_words_after_guess', for boards of word indices."""
+    total = 0.0
+    for indices in boards:
+        counts = Counter(_indexed_patterns(row, indices))
+        squares = sum(c * c for c in counts.values())
+        total += (squares - counts.get(ALL_GREEN_PATTERN, 0)) / len(indices)
+    return total
+
+
+def _indexed_entropy_after_guess(row: Sequence[int], boards: Sequence[array]) -> float:
+    """Same as '_joint_entropy_after_guess', for boards of word indices."""
+    entropy = 0.0
+    for indices in boards:
+        counts = Counter(_indexed_patterns(row, indices))
+        entropy -= sum(
+            c / len(indices) * log2(c / len(indices)) for c in counts.values()
+        )
+    return entropy
+
+
+class ManyWordleSolver:
+    """Multi-board solver that stores all boards as arrays.
+
+    Each board is an array of candidate indices into the shared answer list,
+    plus a done flag.  Boards are narrowed using one cached row of evaluation
+    patterns per guess, so memory and per-step cost grow with the number of
+    live candidates, rather than the number of boards times the vocabulary.
+    """
+
+    def __init__(
+        self,
+        num_words: int,
+        mode: str = "joint-split",
+        endgame_max_words: int = ENDGAME_MAX_WORDS,
+    ):
+        self.num_words = num_words
+        self.mode = mode
+        self.endgame_max_words = endgame_max_words
+        self.vocabulary = load_words()
+        # All boards start out sharing the same array, which is never mutated
+        all_indices = array("H", range(len(self.vocabulary)))
+        self.candidates: List[array] = [all_indices] * num_words
+        self.dones = bytearray(num_words)
+        self._step = 1
+
+    @property
+    def live_boards(self) -> Tuple[array, ...]:
+        """Candidate indices for each board that is not solved yet."""
+        return tuple(
+            indices
+            for indices, done in zip(self.candidates, self.dones)
+            if not done and len(indices) > 0
+        )
+
+    def recommend(self, max_alternatives: int = 5) -> WordRecommendations:
+        if self._step == 1:
+            return WordRecommendations(
+                recommended="slate",
+                alternatives=["blast", "tapir", "ralph"],
+            )
+
+        vocabulary = self.vocabulary
+        boards = self.live_boards
+        words = tuple(tuple(vocabulary[i] for i in indices) for indices in boards)
+        if sum(len(w) for w in words) <= self.endgame_max_words:
+            ranking = _rank_by_endgame_search(words)
+            return _board_recommendations(ranking, (), max_alternatives, "endgame")
+        elif self.mode == "probability":
+            ranking = _rank_by_chain_prob(tuple(chain.from_iterable(words)))
+        elif self.mode == "joint-split":
+            ranking = WordRanking(
+                {
+                    w: _indexed_avg_words_after_guess(
+                        _pattern_row(w, vocabulary), boards
+                    )
+                    for w in _joint_guess_pool(words)
+                }
+            )
+        elif self.mode == "joint-entropy":
+            ranking = WordRanking(
+                {
+                    w: -_indexed_entropy_after_guess(
+                        _pattern_row(w, vocabulary), boards
+                    )
+                    for w in _joint_guess_pool(words)
+                }
+            )
+        else:
+            raise ValueError(f"Solver mode '{self.mode}' is not supported.")
+
+        return _board_recommendations(ranking, words, max_alternatives, self.mode)
+
+    def update(self, step_info: Sequence[Optional[WordleStepInfo]]) -> Optional[str]:
+        self._step += 1
+        for i, info in enumerate(step_info):
+            if info is None or self.dones[i]:
+                continue
+            if info.success:
+                self.dones[i] = 1
+                continue
+
+            row = _pattern_row(info.guess, self.vocabulary)
+            pattern = _pattern_from_step_info(info)
+            self.candidates[i] = array(
+                "H", [j for j in self.candidates[i] if row[j] == pattern]
+            )
+
+        return self.recommend().recommended
+
+
 @lru_cache(maxsize=1024)
 def _filter_words_from_step_info(
     words: Tuple[str, ...], info: WordleStepInfo
@@ -327,18 +1398,20 @@ def _get_input(prompt: str) -> str:
     return input(prompt).lower().strip().replace(" ", "").replace(",", "")
 
 
-def _get_valid_word_input(prompt: str) -> str:
+def _get_valid_word_input(prompt: str, word_length: int = WORD_LENGTH) -> str:
     word = _get_input(prompt)
-    if word in set(load_all_words()):
+    if word in set(load_all_words(word_length)):
         return word
     else:
         print("Not a valid 'Wordle' word! Try again.")
-        return _get_valid_word_input(prompt)
+        return _get_valid_word_input(prompt, word_length=word_length)
 
 
-def _get_wordle_step_info(step: int, guess: Optional[str] = None) -> WordleStepInfo:
+def _get_wordle_step_info(
+    step: int, guess: Optional[str] = None, word_length: int = WORD_LENGTH
+) -> WordleStepInfo:
     if guess is None:
-        guess = _get_valid_word_input("Enter your guess: ")
+        guess = _get_valid_word_input("Enter your guess: ", word_length=word_length)
 
     colors = _get_input(
         "What color was each square?\n(b=black/gray, y=yellow, g=green): "
@@ -357,13 +1430,26 @@ def _get_wordle_step_info(step: int, guess: Optional[str] = None) -> WordleStepI
 
 
 class AssistiveWordleSolver(WordleSolver):
-    def __init__(self, mode: str = "turns-to-win"):
-        super().__init__(mode=mode)
+    def __init__(
+        self,
+        mode: str = "turns-to-win",
+        time_budget_ms: Optional[float] = None,
+        decision_tree: Optional[DecisionTree] = None,
+        word_length: int = WORD_LENGTH,
+    ):
+        super().__init__(
+            mode=mode,
+            time_budget_ms=time_budget_ms,
+            decision_tree=decision_tree,
+            word_length=word_length,
+        )
         self.step = 1
         self.done = False
 
     def get_step_info(self, guess: Optional[str] = None) -> WordleStepInfo:
-        info = _get_wordle_step_info(self.step, guess=guess)
+        info = _get_wordle_step_info(
+            self.step, guess=guess, word_length=self.word_length
+        )
         self.done = info.done
         return info
 
@@ -372,7 +1458,7 @@ class AssistiveWordleSolver(WordleSolver):
         while not self.done:
             print(f"\nStep {self.step}")
             print("-" * 16)
-            remaining = self.words if self.words else self.fallback_words
+            remaining = self.words if self.words else self.fallback.words
             print(f"{len(remaining)} solutions remaining")
             recommendations = self.recommend()
             print(recommendations)
@@ -389,7 +1475,6 @@ class AssistiveMultiWordleSolver(MultiWordleSolver):
     def __init__(self, num_words: int, mode: str = "probability"):
         super().__init__(num_words=num_words, mode=mode)
         self.step = 1
-        self.dones = [False] * num_words
 
     @property
     def done(self):
@@ -451,20 +1536,280 @@ class AssistiveOctordleSolver(AssistiveMultiWordleSolver):
         super().__init__(num_words=8, mode=mode)
 
 
+class AssistiveManyWordleSolver(ManyWordleSolver):
+    def __init__(self, num_words: int, mode: str = "joint-split"):
+        super().__init__(num_words=num_words, mode=mode)
+
+    @property
+    def done(self):
+        return all(self.dones)
+
+    def get_step_info(self) -> List[Optional[WordleStepInfo]]:
+        guess = _get_valid_word_input("Enter your guess: ")
+        step_info: List[Optional[WordleStepInfo]] = []
+        for i, done in enumerate(self.dones, 1):
+            if done:
+                step_info.append(None)
+                continue
+            print(f"Word {i} of {self.num_words}: ")
+            step_info.append(_get_wordle_step_info(step=self._step, guess=guess))
+
+        return step_info
+
+    def solve(self):
+        print("ManyWordle Solver!")
+        while not self.done:
+            print(f"\nStep {self._step}")
+            print("-" * 16)
+            for i, (indices, done) in enumerate(zip(self.candidates, self.dones), 1):
+                print(f"Solver {i} of {self.num_words}: ", end="")
+                if done:
+                    print("DONE")
+                else:
+                    print(f"{len(indices)} solutions remaining")
+            recommendations = self.recommend()
+            print(recommendations)
+            print("-" * 16)
+            self.update(self.get_step_info())
+
+        print("You win! :)")
+
+
+# Unfinished states per worker, beyond which batch input stops being read
+BATCH_MAX_PENDING = 64
+
+
+def _solve_state(
+    state: State,
+    max_alternatives: int = 5,
+    mode: str = "turns-to-win",
+    time_budget_ms: Optional[float] = None,
+    word_length: int = WORD_LENGTH,
+) -> Dict:
+    solver = WordleSolver(
+        mode=mode, time_budget_ms=time_budget_ms, word_length=word_length
+    )
+    for step, (guess, pattern) in enumerate(state, 1):
+        solver.filter(_step_info_from_pattern(guess, pattern, step=step))
+    recommendations = solver.recommend(max_alternatives=max_alternatives)
+    return {
+        "recommended": recommendations.recommended,
+        "alternatives": list(recommendations.alternatives),
+        "num_candidates": len(solver.words),
+        "tier": recommendations.tier,
+    }
+
+
+def _pop_finished(
+    pending: deque, ordered: bool, block: bool = True
+) -> Iterator[Tuple[Any, Future]]:
+    """Pop finished '(id, future)' entries, in input order if 'ordered'."""
+    if ordered:
+        while pending and (block or pending[0][1].done()):
+            yield pending.popleft()
+            block = False
+        return
+
+    if block:
+        wait({f for _, f in pending}, return_when=FIRST_COMPLETED)
+    finished, unfinished = [], []
+    for entry in pending:
+        (finished if entry[1].done() else unfinished).append(entry)
+    pending.clear()
+    pending.extend(unfinished)
+    yield from finished
+
+
+def solve_states(
+    records: Iterable[Dict],
+    ordered: bool = True,
+    num_workers: Optional[int] = None,
+    **kwargs,
+) -> Iterator[Dict]:
+    """Recommendations for a stream of partial games, across worker processes.
+
+    Records contain an optional 'id', plus 'guesses' and 'feedback' so far (see
+    '_steps_from_record').  Identical states are only solved once, among the
+    most recent states.  Invalid records get an 'error' instead of a result, and
+    records that already have an 'error' (e.g. lines that couldn't be parsed, see
+    '_read_records') are passed through.
+    Results are yielded in input order if 'ordered', or as soon as they finish
+    otherwise.  Keyword arguments are passed to each state's 'WordleSolver'.
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    max_pending = BATCH_MAX_PENDING * num_workers
+    word_length = kwargs.get("word_length", WORD_LENGTH)
+    # Recently submitted states, so that memory stays bounded on long streams
+    futures: OrderedDict[State, Future] = OrderedDict()
+    pending: deque = deque()
+
+    def result(record_id: Any, future: Future) -> Dict:
+        try:
+            return {"id": record_id, **future.result()}
+        except Exception as e:
+            return {"id": record_id, "error": f"Failed to solve game state: {e!r}"}
+
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        for record in records:
+            error: Optional[str] = None
+            if not isinstance(record, dict):
+                error = f"Expected a JSON object, but got {type(record).__name__}."
+            elif "error" in record:
+                error = record["error"]
+            else:
+                try:
+                    state = tuple(_steps_from_record(record, word_length=word_length))
+                except (KeyError, TypeError, ValueError) as e:
+                    error = f"Invalid game state: {e!r}"
+
+            if error is not None:
+                future = Future()
+                future.set_result({"error": error})
+            else:
+                future = futures.get(state)
+                if future is None:
+                    future = pool.submit(_solve_state, state, **kwargs)
+                    futures[state] = future
+                    if len(futures) > max_pending:
+                        futures.popitem(last=False)
+                else:
+                    futures.move_to_end(state)
+
+            record_id = record.get("id") if isinstance(record, dict) else None
+            pending.append((record_id, future))
+            block = len(pending) >= max_pending
+            for record_id, finished in _pop_finished(pending, ordered, block=block):
+                yield result(record_id, finished)
+
+        while pending:
+            for record_id, finished in _pop_finished(pending, ordered):
+                yield result(record_id, finished)
+
+
+def _read_records(f: Iterable[str]) -> Iterator[Any]:
+    """Parsed JSON lines.  Lines that aren't valid JSON give an 'error' record."""
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield {"id": None, "error": f"Invalid JSON: {e}"}
+
+
+def _solve_batch(args):
+    f_in = sys.stdin if args.batch == "-" else open(args.batch, "r")
+    f_out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        records = _read_records(f_in)
+        results = solve_states(
+            records,
+            ordered=not args.unordered,
+            num_workers=args.num_workers,
+            mode=args.mode,
+            time_budget_ms=args.time_budget_ms,
+            word_length=args.word_length,
+        )
+        for result in results:
+            f_out.write(json.dumps(result) + "\n")
+            f_out.flush()
+    finally:
+        if f_in is not sys.stdin:
+            f_in.close()
+        if f_out is not sys.stdout:
+            f_out.close()
+
+
 def main_wordle():
     parser = ArgumentParser()
     parser.add_argument("--mode", type=str, default="turns-to-win")
+    parser.add_argument("--time-budget-ms", type=float, default=None)
+    parser.add_argument("--decision-tree", type=str, default=None)
+    parser.add_argument("--word-length", type=int, default=WORD_LENGTH)
+    parser.add_argument(
+        "--batch",
+        type=str,
+        nargs="?",
+        const="-",
+        default=None,
+        help="Solve JSONL game states from a file (or stdin), non-interactively",
+    )
+    parser.add_argument("--output", type=str, default=None)
+    parser.add_argument("--num-workers", type=int, default=None)
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Write batch results as they finish, instead of in input order",
+    )
+    args = parser.parse_args()
+
+    if args.batch is not None:
+        _solve_batch(args)
+        return
+
+    tree = load_decision_tree(args.decision_tree) if args.decision_tree else None
+    AssistiveWordleSolver(
+        mode=args.mode,
+        time_budget_ms=args.time_budget_ms,
+        decision_tree=tree,
+        word_length=args.word_length,
+    ).solve()
+
+
+def _clear_ranking_caches():
+    """Empty the caches behind the rankers, e.g. to time them cold."""
+    for cache in (
+        _eval_pattern,
+        _pattern_row,
+        _rank_by_chain_prob,
+        _rank_by_average_split,
+        _rank_by_maximum_split,
+        _rank_by_entropy,
+        _best_avg_words_in_bucket,
+        _rank_by_lookahead,
+        _rank_by_exhaustive_search,
+        _filter_words_from_step_info,
+    ):
+        cache.cache_clear()
+
+
+def main_calibrate():
+    parser = ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
     args = parser.parse_args()
 
-    AssistiveWordleSolver(mode=args.mode).solve()
+    model = calibrate(
+        CALIBRATED_RANKERS,
+        load_words(),
+        repeats=args.repeats,
+        max_seconds=args.max_seconds,
+        seed=args.seed,
+        verbose=True,
+        clear_caches=_clear_ranking_caches,
+    )
+    save_cost_model(model)
+    print(json.dumps(model.coefficients, indent=2))
 
 
 def main_multi_wordle():
     parser = argparse.ArgumentParser()
     parser.add_argument("--num-words", type=int, required=True)
+    parser.add_argument("--mode", type=str, default="probability")
+    args = parser.parse_args()
+
+    AssistiveMultiWordleSolver(num_words=args.num_words, mode=args.mode).solve()
+
+
+def main_many_wordle():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-words", type=int, required=True)
+    parser.add_argument("--mode", type=str, default="joint-split")
     args = parser.parse_args()
 
-    AssistiveMultiWordleSolver(num_words=args.num_words).solve()
+    AssistiveManyWordleSolver(num_words=args.num_words, mode=args.mode).solve()
 
 
 def main_dordle():
@@ -0,0 +1,128 @@
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+from wordle.data import load_all_words
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.path.pardir, "data")
+OPENING_BOOK_PATH = os.path.join(DATA_DIR, "opening-book.json")
+
+
+@dataclass
+class DecisionTree:
+    """Guess to play, and the subtree to follow for each evaluation pattern.
+
+    Patterns use the base-3 encoding of 'wordle.solver._eval_pattern'.  A node
+    has no child for the all-green pattern, or for patterns that can't occur.
+    Nodes may also store the runner-up guesses, best first, to show as
+    alternatives.
+    """
+
+    guess: str
+    children: Dict[int, "DecisionTree"] = field(default_factory=dict)
+    alternatives: Tuple[str, ...] = ()
+
+    def to_dict(self) -> dict:
+        out: dict = {"guess": self.guess}
+        if self.children:
+            out["children"] = {str(p): c.to_dict() for p, c in self.children.items()}
+        if self.alternatives:
+            out["alternatives"] = list(self.alternatives)
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DecisionTree":
+        children = {
+            int(p): cls.from_dict(c) for p, c in data.get("children", {}).items()
+        }
+        return cls(
+            guess=data["guess"],
+            children=children,
+            alternatives=tuple(data.get("alternatives", ())),
+        )
+
+    def num_nodes(self) -> int:
+        return 1 + sum(c.num_nodes() for c in self.children.values())
+
+
+def decision_tree_path(first_guess: str) -> str:
+    return os.path.join(DATA_DIR, f"decision-tree-{first_guess}.json")
+
+
+def save_decision_tree(
+    tree: DecisionTree, path: str, metadata: Optional[Dict] = None
+) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"metadata": metadata or {}, "tree": tree.to_dict()}, f)
+
+
+def load_decision_tree(path: str) -> DecisionTree:
+    with open(path, "r") as f:
+        return DecisionTree.from_dict(json.load(f)["tree"])
+
+
+def _encode_compact(tree: DecisionTree, index: Dict[str, int]) -> list:
+    # Nodes are '[word index, {pattern: child}, [alternative indices]]', with
+    # trailing fields omitted when they're empty
+    out: list = [
+        index[tree.guess],
+        {str(p): _encode_compact(c, index) for p, c in tree.children.items()},
+        [index[w] for w in tree.alternatives],
+    ]
+    while len(out) > 1 and not out[-1]:
+        out.pop()
+    return out
+
+
+def _decode_compact(data: list, words: Sequence[str]) -> DecisionTree:
+    children = {}
+    if len(data) > 1:
+        children = {int(p): _decode_compact(c, words) for p, c in data[1].items()}
+    alternatives = tuple(words[i] for i in data[2]) if len(data) > 2 else ()
+    return DecisionTree(
+        guess=words[data[0]], children=children, alternatives=alternatives
+    )
+
+
+# Opening books are keyed by '(solver mode, first guess)'
+OpeningBook = Dict[Tuple[str, str], DecisionTree]
+
+
+def save_opening_book(books: OpeningBook, path: str = OPENING_BOOK_PATH):
+    """Save shallow decision trees for each solver mode and first guess.
+
+    Guesses are stored as indices into 'load_all_words()', which keeps the file
+    small even with a third move for every pattern.
+    """
+    words = load_all_words()
+    index = {w: i for i, w in enumerate(words)}
+    encoded: Dict[str, Dict[str, list]] = {}
+    for (mode, first_guess), tree in books.items():
+        encoded.setdefault(mode, {})[first_guess] = _encode_compact(tree, index)
+    data = {"num_words": len(words), "books": encoded}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    load_opening_book.cache_clear()
+
+
+@lru_cache()
+def load_opening_book(path: str = OPENING_BOOK_PATH) -> OpeningBook:
+    """Opening books that have been built, or an empty dict if there are none."""
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, "r") as f:
+        data = json.load(f)
+    words = load_all_words()
+    if data["num_words"] != len(words):
+        # Built for a different word list, so the indices are meaningless
+        return {}
+    return {
+        (mode, first_guess): _decode_compact(tree, words)
+        for mode, trees in data["books"].items()
+        for first_guess, tree in trees.items()
+    }